@@ -7,15 +7,18 @@ from typing import Optional, Union, Dict, List
 
 from intraday_abm.core.types import PublicInfo, AgentPrivateInfo, Side
 from intraday_abm.core.order import Order
-from intraday_abm.agents.pricing_strategies import PricingStrategy
+from intraday_abm.agents.pricing_strategies import PricingStrategy, DAPriceFallbackStrategy
 
 # Import MultiProductPrivateInfo with TYPE_CHECKING to avoid circular imports
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from intraday_abm.core.types import MultiProductPrivateInfo
 
+# Vorzeichen eines Trades für Marktposition und Erlös (SELL: +, BUY: -)
+_SIGN = {Side.SELL: 1.0, Side.BUY: -1.0}
 
-@dataclass
+
+@dataclass(slots=True, eq=False, repr=False)
 class Agent(ABC):
     """
     Abstrakte Basisklasse für alle Agenten - unterstützt Single UND Multi-Product.
@@ -36,7 +39,8 @@ class Agent(ABC):
         id: eindeutige Agenten-ID
         private_info: AgentPrivateInfo (single) oder MultiProductPrivateInfo (multi)
         rng: Agent-lokaler Zufallszahlengenerator
-        pricing_strategy: optionale Preisstrategie (naiv / MTAA nach Shinde)
+        pricing_strategy: Preisstrategie (naiv / MTAA nach Shinde),
+            Default: DAPriceFallbackStrategy (Day-Ahead-Preis, keine Kurve)
         is_multi_product: Flag ob Agent im Multi-Product Modus läuft
     
     Example:
@@ -59,18 +63,22 @@ class Agent(ABC):
 
     id: int
     private_info: Union[AgentPrivateInfo, MultiProductPrivateInfo]
-    rng: Random = field(repr=False)
+    rng: Random
 
     # WICHTIG:
     # - init=False → dieses Feld taucht NICHT als Parameter im __init__ auf.
     #   Damit kollidiert es NICHT mit den Feldern der Kindklassen.
-    # - Default = None → wir können später optional eine Strategy zuweisen.
-    pricing_strategy: Optional[PricingStrategy] = field(
-        default=None,
-        repr=False,
+    # - Default = DAPriceFallbackStrategy → wir können später optional eine
+    #   Strategy zuweisen; bis dahin wird der Day-Ahead-Preis genutzt.
+    pricing_strategy: PricingStrategy = field(
+        default_factory=DAPriceFallbackStrategy,
         init=False,
     )
 
+    # Wird in __post_init__ aus dem Typ von private_info abgeleitet.
+    # (Als Feld deklariert, da die Agenten __slots__ nutzen.)
+    is_multi_product: bool = field(default=False, init=False)
+
     def __post_init__(self):
         """
         Detect if agent is in multi-product mode.
@@ -82,6 +90,11 @@ class Agent(ABC):
             type(self.private_info).__name__ == 'MultiProductPrivateInfo'
         )
 
+    def __repr__(self) -> str:
+        # Bewusst kurz (repr=False im Dataclass-Decorator): keine Ausgabe
+        # von private_info/rng in Logs oder im Debugger.
+        return f"{type(self).__name__}(id={self.id})"
+
     # ------------------------------------------------------------------
     # SINGLE-PRODUCT INTERFACE (Original - bleibt unverändert)
     # ------------------------------------------------------------------
@@ -164,26 +177,19 @@ class Agent(ABC):
             side: BUY or SELL
             product_id: Product traded (Multi-Product only)
         """
+        signed_volume = _SIGN[side] * volume
+        pi = self.private_info
+        
         if self.is_multi_product:
             if product_id is None:
                 raise ValueError("product_id required for multi-product agents")
             
-            # Multi-Product mode
-            pi = self.private_info
-            if side == Side.SELL:
-                pi.update_position(product_id, volume)
-                pi.update_revenue(product_id, volume * price)
-            else:  # BUY
-                pi.update_position(product_id, -volume)
-                pi.update_revenue(product_id, -volume * price)
+            # Multi-Product mode (position + revenue in one update)
+            pi.apply_trade(product_id, signed_volume, price)
         else:
             # Single-Product mode (original)
-            if side == Side.SELL:
-                self.private_info.market_position += volume
-                self.private_info.revenue += volume * price
-            else:  # BUY
-                self.private_info.market_position -= volume
-                self.private_info.revenue -= volume * price
+            pi.market_position += signed_volume
+            pi.revenue += signed_volume * price
 
     def compute_order_price(
         self,
@@ -195,9 +201,9 @@ class Agent(ABC):
         """
         Zentraler Zugriffspunkt für Preisstrategien nach Shinde.
 
-        Falls eine PricingStrategy gesetzt ist, wird deren compute_price(...)
-        verwendet. Andernfalls wird ein einfacher Fallback genutzt
-        (derzeit: Day-Ahead-Preis).
+        Nutzt immer self.pricing_strategy.compute_price(...). Ohne explizit
+        zugewiesene Strategie ist das die DAPriceFallbackStrategy
+        (Day-Ahead-Preis).
         
         Args:
             public_info: Public market information
@@ -207,11 +213,6 @@ class Agent(ABC):
         Returns:
             Order price
         """
-        if self.pricing_strategy is None:
-            # Fallback, damit existierender Code weiterläuft,
-            # solange Agenten noch nicht explizit Strategien zugewiesen bekommen.
-            return public_info.da_price
-
         return self.pricing_strategy.compute_price(
             agent=self,
             public_info=public_info,
@@ -260,7 +261,7 @@ class Agent(ABC):
             if not public_info:
                 return {}
             
-            product_id = list(public_info.keys())[0]
+            product_id = next(iter(public_info))
             single_public = public_info[product_id]
             
             order = self.decide_order(t, single_public)
@@ -23,7 +23,7 @@ from intraday_abm.core.types import PublicInfo, AgentPrivateInfo, MultiProductPr
 from intraday_abm.agents.pricing_strategies import PricingStrategy
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class DispatchableAgent(Agent):
     """
     Shinde 2023 compliant thermal power plant agent.
@@ -236,7 +236,7 @@ class DispatchableAgent(Agent):
             delta: Imbalance from _compute_imbalance_shinde()
             product_id: Product identifier (for multi-product)
         """
-        if not hasattr(self.private_info, 'limit_buy_initial'):
+        if getattr(self.private_info, 'limit_buy_initial', None) is None:
             return
         
         if delta < 0:
@@ -3,6 +3,7 @@ Pricing Strategies für Trading Agents
 
 Enthält:
 - PricingStrategy (Abstract Base Class)
+- DAPriceFallbackStrategy (Default ohne explizite Strategie)
 - NaivePricingStrategy (JETZT Shinde-konform, Equations 20-27)
 - MTAAPricingStrategy (Placeholder)
 """
@@ -76,6 +77,46 @@ class PricingStrategy:
         raise NotImplementedError
 
 
+# ============================================================================
+# FALLBACK STRATEGY (Default für Agenten ohne zugewiesene Strategie)
+# ============================================================================
+
+class DAPriceFallbackStrategy(PricingStrategy):
+    """
+    Default-Strategie, solange einem Agenten keine Strategie zugewiesen wurde.
+    
+    - compute_price(): Day-Ahead-Preis des Produkts
+    - build_price_volume_curve(): leere Kurve → keine Orders
+    
+    Ersetzt die frühere None-Prüfung in Agent.compute_order_price, so dass
+    der Preis immer direkt über self.pricing_strategy berechnet wird.
+    """
+    
+    def __init__(self, rng: Optional[Random] = None):
+        super().__init__(rng)
+    
+    def build_price_volume_curve(
+        self,
+        *,
+        agent: "Agent",
+        public_info: PublicInfo,
+        side: Side,
+        total_volume: float,
+    ) -> List[Tuple[float, float]]:
+        return []
+    
+    def compute_price(
+        self,
+        *,
+        agent: Optional["Agent"] = None,
+        public_info: PublicInfo,
+        side: Side,
+        volume: float,
+        **kwargs,
+    ) -> float:
+        return public_info.da_price
+
+
 # ============================================================================
 # NAIVE STRATEGY (JETZT SHINDE-KONFORM!)
 # ============================================================================
@@ -160,33 +201,23 @@ class NaivePricingStrategy(PricingStrategy):
         """Clippe Preis auf absolute Grenzen."""
         return max(self.min_price, min(self.max_price, p))
     
-    # -------------------------------------------------------------------------
-    # Für RandomLiquidityAgent (Price-Volume-Kurve)
-    # -------------------------------------------------------------------------
-    
-    def build_price_volume_curve(
+    def _price_interval(
         self,
-        *,
         agent: "Agent",
         public_info: PublicInfo,
         side: Side,
-        total_volume: float,
-    ) -> List[Tuple[float, float]]:
+    ) -> Tuple[float, float]:
         """
-        Erstelle Price-Volume-Kurve nach Shinde Naive Strategy (Eqs 20-27).
+        Berechne das geclippte Preisintervall [π_min, π_max] (Equations 20-23).
         
         Args:
-            agent: Agent der die Orders platziert
+            agent: Agent der die Order(s) platziert
             public_info: Aktuelle Marktinformation (ToB, DA-Preis)
             side: BUY oder SELL
-            total_volume: Gesamtvolumen zu verteilen
             
         Returns:
-            Liste von (price, volume) Tupeln
+            (pi_min, pi_max) Tupel
         """
-        if total_volume <= 0.0:
-            return []
-        
         # Hole Top of Book
         tob = public_info.tob
         bbp = tob.best_bid_price if tob.best_bid_price is not None else public_info.da_price
@@ -206,8 +237,36 @@ class NaivePricingStrategy(PricingStrategy):
             pi_max = min(bap + self.pi_range, limit_buy)
         
         # Clippe auf absolute Grenzen
-        pi_min = self._clip_price(pi_min)
-        pi_max = self._clip_price(pi_max)
+        return self._clip_price(pi_min), self._clip_price(pi_max)
+    
+    # -------------------------------------------------------------------------
+    # Für RandomLiquidityAgent (Price-Volume-Kurve)
+    # -------------------------------------------------------------------------
+    
+    def build_price_volume_curve(
+        self,
+        *,
+        agent: "Agent",
+        public_info: PublicInfo,
+        side: Side,
+        total_volume: float,
+    ) -> List[Tuple[float, float]]:
+        """
+        Erstelle Price-Volume-Kurve nach Shinde Naive Strategy (Eqs 20-27).
+        
+        Args:
+            agent: Agent der die Orders platziert
+            public_info: Aktuelle Marktinformation (ToB, DA-Preis)
+            side: BUY oder SELL
+            total_volume: Gesamtvolumen zu verteilen
+            
+        Returns:
+            Liste von (price, volume) Tupeln
+        """
+        if total_volume <= 0.0:
+            return []
+        
+        pi_min, pi_max = self._price_interval(agent, public_info, side)
         
         # Handle degeneriertes Intervall
         if pi_max <= pi_min:
@@ -217,15 +276,12 @@ class NaivePricingStrategy(PricingStrategy):
         # Verteile Volume gleichmäßig (Equation 27)
         vol_per_order = total_volume / float(self.n_orders)
         
-        # Sample n Preise uniform aus [pi_min, pi_max] (SHINDE METHOD)
-        curve: List[Tuple[float, float]] = []
-        
-        for _ in range(self.n_orders):
-            # Uniform Random Sampling aus Preisintervall
-            price = self.rng.uniform(pi_min, pi_max)
-            curve.append((price, vol_per_order))
-        
-        return curve
+        # Sample n Preise uniform aus [pi_min, pi_max] (SHINDE METHOD).
+        # Inline-Form von rng.uniform(pi_min, pi_max) mit identischen Werten,
+        # spart einen Python-Funktionsaufruf pro Order.
+        rnd = self.rng.random
+        width = pi_max - pi_min
+        return [(pi_min + width * rnd(), vol_per_order) for _ in range(self.n_orders)]
     
     # -------------------------------------------------------------------------
     # Für DispatchableAgent / VariableAgent (einzelner Preis)
@@ -256,31 +312,13 @@ class NaivePricingStrategy(PricingStrategy):
             # Fallback zu DA-Preis
             return public_info.da_price
         
-        # Hole Top of Book
-        tob = public_info.tob
-        bbp = tob.best_bid_price if tob.best_bid_price is not None else public_info.da_price
-        bap = tob.best_ask_price if tob.best_ask_price is not None else public_info.da_price
-        
-        # Hole Limit Prices
-        limit_buy, limit_sell = self._get_limit_prices(agent)
-        
-        # Berechne Preisintervall (SHINDE EQUATIONS)
-        if side == Side.SELL:
-            pi_min = max(bbp - self.pi_range, limit_sell)
-            pi_max = max(bap + self.pi_range, limit_sell + self.pi_range)
-        else:  # BUY
-            pi_min = min(bbp - self.pi_range, limit_buy - self.pi_range)
-            pi_max = min(bap + self.pi_range, limit_buy)
-        
-        # Clippe
-        pi_min = self._clip_price(pi_min)
-        pi_max = self._clip_price(pi_max)
+        pi_min, pi_max = self._price_interval(agent, public_info, side)
         
         # Sample
         if pi_max <= pi_min:
             return pi_min
         
-        return self.rng.uniform(pi_min, pi_max)
+        return pi_min + (pi_max - pi_min) * self.rng.random()
 
 
 # ============================================================================
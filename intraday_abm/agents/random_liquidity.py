@@ -12,11 +12,14 @@ from intraday_abm.core.order import Order
 # Global debug file handle
 _debug_file = None
 
+# Debug lines are buffered (no flush per line); close_debug_file() writes the rest
+DEBUG_WRITE_BUFFER = 1024 * 1024
+
 
 def set_debug_file(filepath: str):
     """Set the debug output file."""
     global _debug_file
-    _debug_file = open(filepath, 'w', encoding='utf-8')
+    _debug_file = open(filepath, 'w', encoding='utf-8', buffering=DEBUG_WRITE_BUFFER)
 
 
 def close_debug_file():
@@ -32,10 +35,9 @@ def debug_print(msg: str):
     global _debug_file
     if _debug_file:
         _debug_file.write(msg + '\n')
-        _debug_file.flush()
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RandomLiquidityAgent(Agent):
     """
     Shinde-nahe naive Trader mit diskretem Preisband und mehreren Orders.
@@ -56,6 +58,8 @@ class RandomLiquidityAgent(Agent):
 
     Die Strategy wird von außen (in der Simulation) zugewiesen:
     agent.pricing_strategy = <PricingStrategy-Instanz>
+    Ohne Zuweisung greift DAPriceFallbackStrategy: sie liefert eine leere
+    Price-Volume-Curve, der Agent platziert dann keine Orders.
     
     **Multi-Product Verhalten:**
     - Platziert Orders in ALLEN offenen Produkten
@@ -98,7 +102,8 @@ class RandomLiquidityAgent(Agent):
         Schritte:
         1. Gesamtvolumen abschätzen, das der Agent in diesem Tick bereitstellen
            möchte (auf Basis von min/max_volume und n_orders).
-        2. Über die PricingStrategy eine diskrete Price-Volume-Curve erzeugen.
+        2. Über die PricingStrategy eine diskrete Price-Volume-Curve erzeugen
+           (leere Kurve, z.B. von DAPriceFallbackStrategy → keine Orders).
         3. Für jedes Preis-Volumen-Paar eine Order erzeugen.
         4. **GARANTIERT 50/50 Split zwischen BUY und SELL Orders.**
         
@@ -110,16 +115,14 @@ class RandomLiquidityAgent(Agent):
             List of Orders or None
         """
 
-        # DEBUG
-        debug_print(f"🔍 DEBUG Agent {self.id} decide_order() called at t={t}")
-
-        # Fallback: wenn keine Strategy gesetzt ist, keine Aktivität
-        if self.pricing_strategy is None:
-            debug_print(f"   ❌ Agent {self.id}: pricing_strategy is None!")
-            return None
+        # Debug-Ausgabe nur formatieren, wenn eine Debug-Datei gesetzt ist
+        debug = _debug_file is not None
+        if debug:
+            debug_print(f"🔍 DEBUG Agent {self.id} decide_order() called at t={t}")
 
         if self.n_orders <= 0:
-            debug_print(f"   ❌ Agent {self.id}: n_orders={self.n_orders} <= 0")
+            if debug:
+                debug_print(f"   ❌ Agent {self.id}: n_orders={self.n_orders} <= 0")
             return None
 
         # Einfacher Ansatz: Gesamtvolumen = erwarteter Mittelwert aller Orders
@@ -127,15 +130,18 @@ class RandomLiquidityAgent(Agent):
         total_volume = avg_volume * self.n_orders
 
         if total_volume <= 0.0:
-            debug_print(f"   ❌ Agent {self.id}: total_volume={total_volume} <= 0")
+            if debug:
+                debug_print(f"   ❌ Agent {self.id}: total_volume={total_volume} <= 0")
             return None
 
-        debug_print(f"   ✅ Agent {self.id}: total_volume={total_volume:.2f}")
+        if debug:
+            debug_print(f"   ✅ Agent {self.id}: total_volume={total_volume:.2f}")
 
         # Die Preisstrategie erzeugt eine diskrete Price-Volume-Kurve.
-        debug_print(f"   📊 Agent {self.id}: Calling build_price_volume_curve()...")
-        debug_print(f"      public_info.tob = {public_info.tob}")
-        debug_print(f"      public_info.da_price = {public_info.da_price}")
+        if debug:
+            debug_print(f"   📊 Agent {self.id}: Calling build_price_volume_curve()...")
+            debug_print(f"      public_info.tob = {public_info.tob}")
+            debug_print(f"      public_info.da_price = {public_info.da_price}")
         
         curve = self.pricing_strategy.build_price_volume_curve(
             agent=self,
@@ -144,12 +150,14 @@ class RandomLiquidityAgent(Agent):
             total_volume=total_volume,
         )
 
-        debug_print(f"   📈 Agent {self.id}: Curve returned {len(curve) if curve else 0} price points")
-        if curve:
-            debug_print(f"      Sample prices: {[f'{p:.2f}' for p, v in curve[:3]]}")
+        if debug:
+            debug_print(f"   📈 Agent {self.id}: Curve returned {len(curve) if curve else 0} price points")
+            if curve:
+                debug_print(f"      Sample prices: {[f'{p:.2f}' for p, v in curve[:3]]}")
 
         if not curve:
-            debug_print(f"   ❌ Agent {self.id}: Curve is EMPTY!")
+            if debug:
+                debug_print(f"   ❌ Agent {self.id}: Curve is EMPTY!")
             return None
 
         orders: List[Order] = []
@@ -165,17 +173,20 @@ class RandomLiquidityAgent(Agent):
             order_data.append((price, volume))
         
         if not order_data:
-            debug_print(f"   ❌ Agent {self.id}: order_data is EMPTY after filtering!")
+            if debug:
+                debug_print(f"   ❌ Agent {self.id}: order_data is EMPTY after filtering!")
             return None
         
-        debug_print(f"   ✅ Agent {self.id}: Created {len(order_data)} order_data entries")
+        if debug:
+            debug_print(f"   ✅ Agent {self.id}: Created {len(order_data)} order_data entries")
         
         # Garantiere 50/50 Split zwischen BUY und SELL
         n_orders_total = len(order_data)
         n_buy = n_orders_total // 2
         n_sell = n_orders_total - n_buy
         
-        debug_print(f"   🎯 Agent {self.id}: Split → {n_buy} BUY, {n_sell} SELL")
+        if debug:
+            debug_print(f"   🎯 Agent {self.id}: Split → {n_buy} BUY, {n_sell} SELL")
         
         # Erstelle BUY Orders (erste Hälfte)
         for i in range(n_buy):
@@ -206,14 +217,16 @@ class RandomLiquidityAgent(Agent):
         # Shuffle für Fairness (aber Side-Ratio bleibt 50/50)
         self.rng.shuffle(orders)
 
-        debug_print(f"   ✅ Agent {self.id}: Returning {len(orders)} orders")
-        if orders:
-            buy_count = sum(1 for o in orders if o.side == Side.BUY)
-            sell_count = sum(1 for o in orders if o.side == Side.SELL)
-            debug_print(f"      Distribution: {buy_count} BUY, {sell_count} SELL")
+        if debug:
+            debug_print(f"   ✅ Agent {self.id}: Returning {len(orders)} orders")
+            if orders:
+                buy_count = sum(1 for o in orders if o.side == Side.BUY)
+                sell_count = sum(1 for o in orders if o.side == Side.SELL)
+                debug_print(f"      Distribution: {buy_count} BUY, {sell_count} SELL")
 
         if not orders:
-            debug_print(f"   ❌ Agent {self.id}: Final orders list is EMPTY!")
+            if debug:
+                debug_print(f"   ❌ Agent {self.id}: Final orders list is EMPTY!")
             return None
 
         return orders
@@ -242,24 +255,32 @@ class RandomLiquidityAgent(Agent):
         Returns:
             Dict mapping product_id to List[Order]
         """
-        debug_print(f"\n🔍 DEBUG Agent {self.id} decide_orders() called at t={t} for {len(public_info)} products")
+        debug = _debug_file is not None
+        if debug:
+            debug_print(f"\n🔍 DEBUG Agent {self.id} decide_orders() called at t={t} for {len(public_info)} products")
         
         if not self.is_multi_product:
             # Fallback to single-product
-            return super().decide_orders(t, public_info)
+            # super() mit Argumenten: slots=True erzeugt eine neue Klasse,
+            # mit der das argumentlose super() nicht funktioniert.
+            return super(RandomLiquidityAgent, self).decide_orders(t, public_info)
         
         all_orders = {}
         
         for product_id, pub_info in public_info.items():
-            debug_print(f"   📦 Agent {self.id} deciding for Product {product_id}...")
+            if debug:
+                debug_print(f"   📦 Agent {self.id} deciding for Product {product_id}...")
             orders = self._decide_for_product(t, product_id, pub_info)
             if orders:
                 all_orders[product_id] = orders
-                debug_print(f"      ✅ Added {len(orders)} orders for Product {product_id}")
+                if debug:
+                    debug_print(f"      ✅ Added {len(orders)} orders for Product {product_id}")
             else:
-                debug_print(f"      ❌ No orders for Product {product_id}")
+                if debug:
+                    debug_print(f"      ❌ No orders for Product {product_id}")
         
-        debug_print(f"   📊 Agent {self.id} total: {len(all_orders)} products with orders")
+        if debug:
+            debug_print(f"   📊 Agent {self.id} total: {len(all_orders)} products with orders")
         return all_orders
 
     def _decide_for_product(
@@ -283,16 +304,14 @@ class RandomLiquidityAgent(Agent):
         Returns:
             List of Orders or None
         """
-        # DEBUG
-        debug_print(f"      🔍 _decide_for_product: Agent {self.id}, Product {product_id}")
+        # Debug-Ausgabe nur formatieren, wenn eine Debug-Datei gesetzt ist
+        debug = _debug_file is not None
+        if debug:
+            debug_print(f"      🔍 _decide_for_product: Agent {self.id}, Product {product_id}")
         
-        # Fallback: wenn keine Strategy gesetzt ist, keine Aktivität
-        if self.pricing_strategy is None:
-            debug_print(f"         ❌ pricing_strategy is None!")
-            return None
-
         if self.n_orders <= 0:
-            debug_print(f"         ❌ n_orders={self.n_orders} <= 0")
+            if debug:
+                debug_print(f"         ❌ n_orders={self.n_orders} <= 0")
             return None
 
         # Einfacher Ansatz: Gesamtvolumen = erwarteter Mittelwert aller Orders
@@ -300,15 +319,18 @@ class RandomLiquidityAgent(Agent):
         total_volume = avg_volume * self.n_orders
 
         if total_volume <= 0.0:
-            debug_print(f"         ❌ total_volume={total_volume} <= 0")
+            if debug:
+                debug_print(f"         ❌ total_volume={total_volume} <= 0")
             return None
 
-        debug_print(f"         ✅ total_volume={total_volume:.2f}")
+        if debug:
+            debug_print(f"         ✅ total_volume={total_volume:.2f}")
 
         # Die Preisstrategie erzeugt eine diskrete Price-Volume-Kurve.
-        debug_print(f"         📊 Calling build_price_volume_curve()...")
-        debug_print(f"            tob = {public_info.tob}")
-        debug_print(f"            da_price = {public_info.da_price}")
+        if debug:
+            debug_print(f"         📊 Calling build_price_volume_curve()...")
+            debug_print(f"            tob = {public_info.tob}")
+            debug_print(f"            da_price = {public_info.da_price}")
         
         curve = self.pricing_strategy.build_price_volume_curve(
             agent=self,
@@ -317,10 +339,12 @@ class RandomLiquidityAgent(Agent):
             total_volume=total_volume,
         )
 
-        debug_print(f"         📈 Curve returned {len(curve) if curve else 0} price points")
+        if debug:
+            debug_print(f"         📈 Curve returned {len(curve) if curve else 0} price points")
 
         if not curve:
-            debug_print(f"         ❌ Curve is EMPTY!")
+            if debug:
+                debug_print(f"         ❌ Curve is EMPTY!")
             return None
 
         orders: List[Order] = []
@@ -336,17 +360,20 @@ class RandomLiquidityAgent(Agent):
             order_data.append((price, volume))
         
         if not order_data:
-            debug_print(f"         ❌ order_data is EMPTY after filtering!")
+            if debug:
+                debug_print(f"         ❌ order_data is EMPTY after filtering!")
             return None
         
-        debug_print(f"         ✅ Created {len(order_data)} order_data entries")
+        if debug:
+            debug_print(f"         ✅ Created {len(order_data)} order_data entries")
         
         # Garantiere 50/50 Split zwischen BUY und SELL
         n_orders_total = len(order_data)
         n_buy = n_orders_total // 2
         n_sell = n_orders_total - n_buy
         
-        debug_print(f"         🎯 Split → {n_buy} BUY, {n_sell} SELL")
+        if debug:
+            debug_print(f"         🎯 Split → {n_buy} BUY, {n_sell} SELL")
         
         # Erstelle BUY Orders (erste Hälfte)
         for i in range(n_buy):
@@ -377,14 +404,16 @@ class RandomLiquidityAgent(Agent):
         # Shuffle für Fairness (aber Side-Ratio bleibt 50/50)
         self.rng.shuffle(orders)
 
-        debug_print(f"         ✅ Returning {len(orders)} orders")
-        if orders:
-            buy_count = sum(1 for o in orders if o.side == Side.BUY)
-            sell_count = sum(1 for o in orders if o.side == Side.SELL)
-            debug_print(f"            Distribution: {buy_count} BUY, {sell_count} SELL")
+        if debug:
+            debug_print(f"         ✅ Returning {len(orders)} orders")
+            if orders:
+                buy_count = sum(1 for o in orders if o.side == Side.BUY)
+                sell_count = sum(1 for o in orders if o.side == Side.SELL)
+                debug_print(f"            Distribution: {buy_count} BUY, {sell_count} SELL")
 
         if not orders:
-            debug_print(f"         ❌ Final orders list is EMPTY!")
+            if debug:
+                debug_print(f"         ❌ Final orders list is EMPTY!")
             return None
 
         return orders
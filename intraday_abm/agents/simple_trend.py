@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 from intraday_abm.agents.base import Agent
@@ -8,7 +8,7 @@ from intraday_abm.core.types import Side, PublicInfo, AgentPrivateInfo, TimeInFo
 from intraday_abm.core.order import Order
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class SimpleTrendAgent(Agent):
     """
     Heuristischer Agent, der auf einfache Preis-Trends reagiert.
@@ -17,7 +17,7 @@ class SimpleTrendAgent(Agent):
     - demonstriert, wie ein Agent PublicInfo (TOB + DA-Preis) nutzt
     - nicht als finale, ökonomisch fundierte Strategie gedacht
     """
-    last_midprice: Optional[float] = field(default=None, repr=False)
+    last_midprice: Optional[float] = None
     base_volume: float = 5.0
 
     def decide_order(self, t: int, public_info: PublicInfo) -> Optional[Order]:
@@ -8,7 +8,7 @@ from intraday_abm.core.types import PublicInfo, AgentPrivateInfo, Side, TimeInFo
 from intraday_abm.core.order import Order
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class VariableAgent(Agent):
     """
     Shinde-inspirierter „variable agent" (z.B. Wind/PV/variable Last).
@@ -54,7 +54,7 @@ class VariableAgent(Agent):
         - Andernfalls wird eine konstante Basisgröße (base_forecast) zurückgegeben.
         
         **Multi-Product Mode:**
-        - Nutzt private_info.forecasts[product_id]
+        - Nutzt private_info.get_forecast(product_id)
         - Forecasts werden pro Produkt gespeichert und können sich unabhängig entwickeln
         
         Args:
@@ -68,7 +68,7 @@ class VariableAgent(Agent):
             if product_id is None:
                 raise ValueError("product_id required in multi-product mode")
             # Multi-Product: nutze gespeicherten Forecast
-            return self.private_info.forecasts.get(product_id, self.base_forecast)
+            return self.private_info.get_forecast(product_id, self.base_forecast)
         else:
             # Single-Product: nutze forecast_fn oder base_forecast
             if self.forecast_fn is not None:
@@ -91,7 +91,7 @@ class VariableAgent(Agent):
         
         Example:
             # Random walk mit mean reversion
-            current = agent.private_info.forecasts[product_id]
+            current = agent.private_info.get_forecast(product_id)
             error = agent.rng.gauss(0, 2.0)
             reversion = 0.1 * (agent.base_forecast - current)
             agent.update_forecast(t, product_id, error + reversion)
@@ -99,13 +99,13 @@ class VariableAgent(Agent):
         if not self.is_multi_product:
             return  # Ignore in single-product mode
         
-        current = self.private_info.forecasts.get(product_id, self.base_forecast)
+        current = self.private_info.get_forecast(product_id, self.base_forecast)
         new_forecast = current + delta
         
         # Optional: Clipping auf sinnvolle Grenzen
         # new_forecast = max(0.0, min(self.private_info.capacities[product_id], new_forecast))
         
-        self.private_info.forecasts[product_id] = new_forecast
+        self.private_info.update_forecast(product_id, new_forecast)
 
     def update_imbalance(self, t: int, product_id: Optional[int] = None) -> None:
         """
@@ -237,7 +237,9 @@ class VariableAgent(Agent):
         """
         if not self.is_multi_product:
             # Fallback to single-product
-            return super().decide_orders(t, public_info)
+            # super() mit Argumenten: slots=True erzeugt eine neue Klasse,
+            # mit der das argumentlose super() nicht funktioniert.
+            return super(VariableAgent, self).decide_orders(t, public_info)
         
         orders = {}
         
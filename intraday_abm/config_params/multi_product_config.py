@@ -257,6 +257,21 @@ class Demo4Config:
     csv_filename: str = "demo4_simulation.csv"
     """CSV filename for export"""
     
+    export_parquet: bool = False
+    """Export results to Parquet (columnar, compressed; requires pyarrow or fastparquet)"""
+    
+    parquet_filename: str = "demo4_simulation.parquet"
+    """Parquet filename for export"""
+    
+    export_feather: bool = False
+    """Export results to Feather/Arrow IPC (fastest binary round-trip; requires pyarrow)"""
+    
+    feather_filename: str = "demo4_simulation.feather"
+    """Feather filename for export"""
+    
+    export_compression: Literal['zstd', 'snappy', 'lz4', 'none'] = 'zstd'
+    """Compression codec for Parquet/Feather export"""
+    
     # ========== LOGGING SETTINGS ==========
     enable_logging: bool = True
     """Enable structured logging"""
@@ -458,6 +473,14 @@ class Demo4Config:
         print(f"   CSV Export:            {self.export_csv}")
         if self.export_csv:
             print(f"   CSV Filename:          {self.csv_filename}")
+        print(f"   Parquet Export:        {self.export_parquet}")
+        if self.export_parquet:
+            print(f"   Parquet Filename:      {self.parquet_filename}")
+        print(f"   Feather Export:        {self.export_feather}")
+        if self.export_feather:
+            print(f"   Feather Filename:      {self.feather_filename}")
+        if self.export_parquet or self.export_feather:
+            print(f"   Compression:           {self.export_compression}")
         
         print("="*70)
 
@@ -507,6 +530,18 @@ FAST_TEST_CONFIG = Demo4Config(
     verbose=False,
 )
 
+# Smoke Test Configuration (health check in well under a second, no file output)
+SMOKE_TEST_CONFIG = Demo4Config(
+    n_products=12,                    # 3 hours of quarter-hour products
+    n_steps=300,                      # ~1/10 of the default run (~2861 steps)
+    n_variable_agents=2,
+    n_random_liquidity_agents=2,
+    n_thermal_agents=1,
+    export_csv=False,
+    log_to_file=False,
+    verbose=False,
+)
+
 # High Volatility Configuration
 HIGH_VOLATILITY_CONFIG = Demo4Config(
     price_volatility=15.0,
@@ -521,6 +556,16 @@ SUMMER_CONFIG = Demo4Config(
     variable_wind_share=0.5,
 )
 
+# Preset lookup by name (e.g. for `run_multi_product_simulation.py --config fast`)
+PRESET_CONFIGS = {
+    'default': DEFAULT_DEMO4_CONFIG,
+    'high_liquidity': HIGH_LIQUIDITY_CONFIG,
+    'fast': FAST_TEST_CONFIG,
+    'smoke': SMOKE_TEST_CONFIG,
+    'high_volatility': HIGH_VOLATILITY_CONFIG,
+    'summer': SUMMER_CONFIG,
+}
+
 
 if __name__ == "__main__":
     # Demo: Show configuration summary
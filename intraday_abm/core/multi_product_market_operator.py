@@ -8,14 +8,23 @@ product-specific order books and routes orders to the correct product.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import is_
 from typing import Dict, List, Optional
 
-from intraday_abm.core.product import Product, ProductStatus
+import numpy as np
+
+from intraday_abm.core.product import Product, ProductStatus, products_to_array
 from intraday_abm.core.product_aware_order_book import ProductAwareOrderBook
 from intraday_abm.core.order import Order, Trade
 from intraday_abm.core.types import TopOfBook, PublicInfo
 
 
+# Lifecycle status codes for the vectorized gate checks (index = code)
+_STATUSES = (ProductStatus.PENDING, ProductStatus.OPEN, ProductStatus.CLOSED, ProductStatus.SETTLED)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+_PENDING, _OPEN, _CLOSED, _SETTLED = range(len(_STATUSES))
+
+
 @dataclass
 class MultiProductMarketOperator:
     """
@@ -30,6 +39,13 @@ class MultiProductMarketOperator:
         order_books: Dict mapping product_id to ProductAwareOrderBook
         next_order_id: Counter for assigning unique order IDs
     
+    Gate times and status codes of self.products are cached in NumPy
+    arrays (one row per product), so the per-step lifecycle update is a
+    set of array masks instead of a Python loop over all products.
+    _set_status updates the status array in place; the cache is rebuilt
+    whenever a Product in self.products is no longer the one it was
+    built from (e.g. replaced from outside via product.update_status()).
+    
     Example:
         from intraday_abm.core.product import create_hourly_products
         
@@ -50,6 +66,12 @@ class MultiProductMarketOperator:
     order_books: Dict[int, ProductAwareOrderBook] = field(default_factory=dict)
     next_order_id: int = 1
     
+    # Lifecycle cache: gate times, status codes and the Product objects
+    # they were built from (row order = self.products order)
+    _gates: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _status_codes: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _cached_products: List[Product] = field(default_factory=list, init=False, repr=False)
+    
     # ------------------------------------------------------------------
     # Factory Methods
     # ------------------------------------------------------------------
@@ -84,6 +106,39 @@ class MultiProductMarketOperator:
     # Product Lifecycle Management
     # ------------------------------------------------------------------
     
+    def _lifecycle_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gate-time records (PRODUCT_RECORD_DTYPE) and status codes per product.
+        
+        Reused as long as self.products still holds the same Product
+        objects (identity check, ~3 µs for 96 products); rebuilt otherwise.
+        
+        Returns:
+            (gates, status_codes) in self.products order
+        """
+        products = self.products.values()
+        if len(self._cached_products) != len(products) or not all(
+            map(is_, self._cached_products, products)
+        ):
+            self._cached_products = list(products)
+            self._gates = products_to_array(self._cached_products)
+            self._status_codes = np.array(
+                [_STATUS_CODE[p.status] for p in self._cached_products], dtype=np.int8
+            )
+        return self._gates, self._status_codes
+    
+    def _set_status(self, row: int, product_id: int, product: Product, new_status: ProductStatus) -> None:
+        """Update product status in products, order book and lifecycle cache."""
+        updated_product = product.update_status(new_status)
+        self.products[product_id] = updated_product
+        
+        # Update order book's product reference
+        self.order_books[product_id].product = updated_product
+        
+        # Keep the cache valid for the replaced Product
+        self._cached_products[row] = updated_product
+        self._status_codes[row] = _STATUS_CODE[new_status]
+    
     def update_product_status(self, t: int) -> List[int]:
         """
         Update product statuses based on current time and close expired products.
@@ -107,15 +162,26 @@ class MultiProductMarketOperator:
         """
         closed_products = []
         
-        for product_id, product in self.products.items():
-            new_status = None
+        gates, status = self._lifecycle_arrays()
+        # Transitions due at t (status is exclusive, so at most one per product):
+        # PENDING → OPEN at gate_open, OPEN → CLOSED at gate_close,
+        # CLOSED → SETTLED at delivery_end
+        due = (
+            ((status == _PENDING) & (gates["gate_open"] <= t))
+            | ((status == _OPEN) & (gates["gate_close"] <= t))
+            | ((status == _CLOSED) & (gates["delivery_end"] <= t))
+        )
+        
+        for row in np.flatnonzero(due).tolist():
+            product_id = int(gates["product_id"][row])
+            product = self.products[product_id]
             
             # PENDING → OPEN: reached gate_open
-            if product.status == ProductStatus.PENDING and t >= product.gate_open:
+            if status[row] == _PENDING:
                 new_status = ProductStatus.OPEN
             
             # OPEN → CLOSED: reached gate_close
-            elif product.status == ProductStatus.OPEN and t >= product.gate_close:
+            elif status[row] == _OPEN:
                 new_status = ProductStatus.CLOSED
                 closed_products.append(product_id)
                 
@@ -126,16 +192,10 @@ class MultiProductMarketOperator:
                     print(f"  Product {product_id}: Cancelled {cancelled_count} orders at gate-close")
             
             # CLOSED → SETTLED: finished delivery
-            elif product.status == ProductStatus.CLOSED and t >= product.delivery_end:
+            else:
                 new_status = ProductStatus.SETTLED
             
-            # Update product status if changed
-            if new_status is not None:
-                updated_product = product.update_status(new_status)
-                self.products[product_id] = updated_product
-                
-                # Update order book's product reference
-                self.order_books[product_id].product = updated_product
+            self._set_status(row, product_id, product, new_status)
         
         return closed_products
     
@@ -154,14 +214,13 @@ class MultiProductMarketOperator:
         """
         opened = []
         
-        for product_id, product in self.products.items():
-            # Open any PENDING product where gate_open time has been reached
-            if product.status == ProductStatus.PENDING:
-                if t >= product.gate_open:
-                    updated = product.update_status(ProductStatus.OPEN)
-                    self.products[product_id] = updated
-                    self.order_books[product_id].product = updated
-                    opened.append(product_id)
+        gates, status = self._lifecycle_arrays()
+        # Open any PENDING product where gate_open time has been reached
+        due = (status == _PENDING) & (gates["gate_open"] <= t)
+        for row in np.flatnonzero(due).tolist():
+            product_id = int(gates["product_id"][row])
+            self._set_status(row, product_id, self.products[product_id], ProductStatus.OPEN)
+            opened.append(product_id)
         
         return opened
     
@@ -175,6 +234,7 @@ class MultiProductMarketOperator:
         Returns:
             List of product_ids where status is OPEN and within trading window
         """
+        # Plain loop: with ~100 books the NumPy mask is not faster
         return [
             product_id
             for product_id, ob in self.order_books.items()
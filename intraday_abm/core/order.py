@@ -6,7 +6,7 @@ from typing import Optional
 from intraday_abm.core.types import Side, TimeInForce
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Repräsentiert eine Limit-Order im Orderbuch.
@@ -43,7 +43,7 @@ class Order:
     timestamp: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Ausgeführter Handel zwischen zwei Orders (Pay-as-Bid).
@@ -16,10 +16,27 @@ from __future__ import annotations
 
 from enum import Enum
 from dataclasses import dataclass, replace
-from typing import Optional, List, Literal
+from functools import lru_cache
+from typing import Optional, List, Literal, Tuple
 import numpy as np
 
 
+# Quarterly product grid: product_id = hour * QUARTERS_PER_HOUR + quarter
+QUARTERS_PER_HOUR = 4
+N_QUARTERLY_PRODUCTS = 24 * QUARTERS_PER_HOUR
+
+# Structured dtype for Product.as_record() / products_to_array()
+PRODUCT_RECORD_DTYPE = np.dtype([
+    ("product_id", np.int32),
+    ("delivery_start", np.int32),
+    ("delivery_end", np.int32),
+    ("gate_open", np.int32),
+    ("gate_close", np.int32),
+    ("duration", np.int32),
+    ("da_price", np.float64),
+])
+
+
 class ProductStatus(Enum):
     """
     Lifecycle states of a delivery product in the CID market.
@@ -35,7 +52,7 @@ class ProductStatus(Enum):
     SETTLED = "settled"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Product:
     """
     Represents a delivery product in the CID market.
@@ -132,6 +149,24 @@ class Product:
         """
         return replace(self, status=new_status)
     
+    def as_record(self) -> tuple:
+        """
+        Return the numeric fields as a row matching PRODUCT_RECORD_DTYPE.
+        
+        Returns:
+            (product_id, delivery_start, delivery_end, gate_open,
+             gate_close, duration, da_price) tuple
+        """
+        return (
+            self.product_id,
+            self.delivery_start,
+            self.delivery_end,
+            self.gate_open,
+            self.gate_close,
+            self.duration,
+            self.da_price,
+        )
+    
     def __repr__(self) -> str:
         name_str = f", name={self.name}" if self.name else ""
         return (
@@ -349,6 +384,21 @@ def create_hourly_products(
     elif len(da_prices) != n_hours:
         raise ValueError(f"da_prices length ({len(da_prices)}) must match n_hours ({n_hours})")
     
+    # Deterministic for given arguments: reuse the (immutable) products
+    return list(_create_hourly_products_cached(
+        n_hours, start_time, gate_open_offset_hours, gate_close_offset_minutes, tuple(da_prices)
+    ))
+
+
+@lru_cache(maxsize=32)
+def _create_hourly_products_cached(
+    n_hours: int,
+    start_time: int,
+    gate_open_offset_hours: int,
+    gate_close_offset_minutes: int,
+    da_prices: Tuple[float, ...],
+) -> Tuple[Product, ...]:
+    """Cached body of create_hourly_products (hashable arguments only)."""
     products = []
     for i in range(n_hours):
         config = ProductConfig(
@@ -362,7 +412,7 @@ def create_hourly_products(
         )
         products.append(config.to_product())
     
-    return products
+    return tuple(products)
 
 
 def create_quarter_hourly_products(
@@ -466,8 +516,52 @@ def create_quarterly_products(
         for p in products[:4]:
             print(f"{p.name}: DA={p.da_price:.2f} EUR/MWh")
     """
-    rng = np.random.default_rng(seed) if seed is not None else np.random.default_rng()
-    
+    # Seeded calls are deterministic: reuse the (immutable) products
+    if seed is not None:
+        return list(_create_quarterly_products_cached(
+            n_hours, start_time, gate_open_offset_hours, gate_close_offset_minutes,
+            season, base_da_price, price_volatility, add_stochastic_volatility, seed
+        ))
+    
+    return _build_quarterly_products(
+        n_hours, start_time, gate_open_offset_hours, gate_close_offset_minutes,
+        season, base_da_price, price_volatility, add_stochastic_volatility,
+        np.random.default_rng()
+    )
+
+
+@lru_cache(maxsize=32)
+def _create_quarterly_products_cached(
+    n_hours: int,
+    start_time: int,
+    gate_open_offset_hours: int,
+    gate_close_offset_minutes: int,
+    season: str,
+    base_da_price: float,
+    price_volatility: float,
+    add_stochastic_volatility: bool,
+    seed: int
+) -> Tuple[Product, ...]:
+    """Memoized seeded variant of create_quarterly_products (Products are frozen)."""
+    return tuple(_build_quarterly_products(
+        n_hours, start_time, gate_open_offset_hours, gate_close_offset_minutes,
+        season, base_da_price, price_volatility, add_stochastic_volatility,
+        np.random.default_rng(seed)
+    ))
+
+
+def _build_quarterly_products(
+    n_hours: int,
+    start_time: int,
+    gate_open_offset_hours: int,
+    gate_close_offset_minutes: int,
+    season: str,
+    base_da_price: float,
+    price_volatility: float,
+    add_stochastic_volatility: bool,
+    rng: np.random.Generator
+) -> List[Product]:
+    """Build the quarterly products using the given random generator."""
     products = []
     product_id = 0
     
@@ -557,6 +651,23 @@ def create_single_product(
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def products_to_array(products: List[Product]) -> np.ndarray:
+    """
+    Convert products to a NumPy structured array (one row per product).
+    
+    Args:
+        products: List of Product instances
+        
+    Returns:
+        Structured array with dtype PRODUCT_RECORD_DTYPE
+        
+    Example:
+        arr = products_to_array(create_quarterly_products(seed=42))
+        hourly = arr['da_price'].reshape(24, 4).mean(axis=1)
+    """
+    return np.array([p.as_record() for p in products], dtype=PRODUCT_RECORD_DTYPE)
+
+
 def print_quarterly_products_summary(products: List[Product]) -> None:
     """
     Print summary of quarterly products with DA price statistics.
@@ -577,16 +688,17 @@ def print_quarterly_products_summary(products: List[Product]) -> None:
     print(f"\nTotal Products: {len(products)}")
     
     # DA Price statistics
-    da_prices = [p.da_price for p in products]
+    records = products_to_array(products)
+    da_prices = records["da_price"]
     print(f"\nDA PRICE STATISTICS:")
-    print(f"   Min:     {min(da_prices):.2f} EUR/MWh")
-    print(f"   Max:     {max(da_prices):.2f} EUR/MWh")
+    print(f"   Min:     {da_prices.min():.2f} EUR/MWh")
+    print(f"   Max:     {da_prices.max():.2f} EUR/MWh")
     print(f"   Mean:    {np.mean(da_prices):.2f} EUR/MWh")
     print(f"   Std Dev: {np.std(da_prices):.2f} EUR/MWh")
     
     # Sample products
     print(f"\nSAMPLE PRODUCTS:")
-    if len(products) >= 96:
+    if len(products) >= N_QUARTERLY_PRODUCTS:
         sample_indices = [0, 12, 48, 72, 95]  # H00Q1, H03Q1, H12Q1, H18Q1, H23Q4
     else:
         sample_indices = list(range(min(5, len(products))))
@@ -598,22 +710,19 @@ def print_quarterly_products_summary(products: List[Product]) -> None:
             print(f"   {name_str}: Delivery {p.delivery_start}-{p.delivery_end} min, "
                   f"DA={p.da_price:.2f} EUR/MWh, Gate {p.gate_open}-{p.gate_close}")
     
-    # Hourly averages (if we have 96 products)
-    if len(products) == 96:
+    # Hourly averages (if we have the full quarterly grid)
+    if len(products) == N_QUARTERLY_PRODUCTS:
+        # (hour, quarter) price matrix in product_id order
+        by_id = np.sort(records, order="product_id")
+        hourly = by_id["da_price"].reshape(-1, QUARTERS_PER_HOUR)
+        
         print(f"\nHOURLY AVERAGE DA PRICES:")
         for hour in [0, 6, 12, 18, 23]:
-            hour_products = [p for p in products if hour * 4 <= p.product_id < (hour + 1) * 4]
-            if hour_products:
-                avg_price = np.mean([p.da_price for p in hour_products])
-                print(f"   H{hour:02d}: {avg_price:.2f} EUR/MWh (Q1-Q4 average)")
+            print(f"   H{hour:02d}: {hourly[hour].mean():.2f} EUR/MWh (Q1-Q4 average)")
         
         # Peak vs Off-Peak
-        peak_products = [p for p in products if 8 * 4 <= p.product_id < 20 * 4]
-        off_peak_products = [p for p in products if p.product_id < 8 * 4 or p.product_id >= 20 * 4]
-        
-        if peak_products and off_peak_products:
-            print(f"\nPEAK vs OFF-PEAK:")
-            print(f"   Peak (H08-H19):    {np.mean([p.da_price for p in peak_products]):.2f} EUR/MWh")
-            print(f"   Off-Peak (H00-H07, H20-H23): {np.mean([p.da_price for p in off_peak_products]):.2f} EUR/MWh")
+        print(f"\nPEAK vs OFF-PEAK:")
+        print(f"   Peak (H08-H19):    {hourly[8:20].mean():.2f} EUR/MWh")
+        print(f"   Off-Peak (H00-H07, H20-H23): {np.concatenate((hourly[:8], hourly[20:])).mean():.2f} EUR/MWh")
     
     print("\n" + "="*70)
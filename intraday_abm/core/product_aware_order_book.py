@@ -10,6 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from collections import defaultdict
+from bisect import insort, bisect_left
 
 from intraday_abm.core.order import Order, Trade
 from intraday_abm.core.types import Side
@@ -30,6 +31,11 @@ class ProductAwareOrderBook:
         bids: Dict mapping price levels to list of buy orders (descending priority)
         asks: Dict mapping price levels to list of sell orders (ascending priority)
     
+    Occupied price levels are additionally kept in ascending sorted lists,
+    so top-of-book lookups during matching are O(1) instead of a max/min
+    scan over all levels. The number of resting orders is tracked as a
+    counter, so len(book) does not walk the price levels.
+    
     Example:
         from intraday_abm.core.product import create_single_product
         
@@ -43,13 +49,22 @@ class ProductAwareOrderBook:
     product: Product
     bids: Dict[float, List[Order]] = field(default_factory=lambda: defaultdict(list))
     asks: Dict[float, List[Order]] = field(default_factory=lambda: defaultdict(list))
+    _bid_prices: List[float] = field(default_factory=list, init=False, repr=False)
+    _ask_prices: List[float] = field(default_factory=list, init=False, repr=False)
+    _n_orders: int = field(default=0, init=False, repr=False)
     
     def __post_init__(self):
-        """Convert regular dicts to defaultdicts if needed."""
+        """Convert regular dicts to defaultdicts if needed and index price levels."""
         if not isinstance(self.bids, defaultdict):
             self.bids = defaultdict(list, self.bids)
         if not isinstance(self.asks, defaultdict):
             self.asks = defaultdict(list, self.asks)
+        self._bid_prices = sorted(p for p, level in self.bids.items() if level)
+        self._ask_prices = sorted(p for p, level in self.asks.items() if level)
+        self._n_orders = (
+            sum(len(orders) for orders in self.bids.values()) +
+            sum(len(orders) for orders in self.asks.values())
+        )
     
     # ------------------------------------------------------------------
     # Product Lifecycle Checks
@@ -119,9 +134,15 @@ class ProductAwareOrderBook:
         
         # Add to appropriate side
         if order.side == Side.BUY:
-            self.bids[order.price].append(order)
+            book, prices = self.bids, self._bid_prices
         else:
-            self.asks[order.price].append(order)
+            book, prices = self.asks, self._ask_prices
+        level = book.get(order.price)
+        if not level:
+            book[order.price] = level = []
+            insort(prices, order.price)
+        level.append(order)
+        self._n_orders += 1
     
     def remove_order(self, order: Order) -> None:
         """
@@ -131,17 +152,23 @@ class ProductAwareOrderBook:
             order: Order to remove
         """
         if order.side == Side.BUY:
-            level = self.bids.get(order.price, [])
-            if order in level:
-                level.remove(order)
-            if not level and order.price in self.bids:
-                del self.bids[order.price]
+            book, prices = self.bids, self._bid_prices
         else:
-            level = self.asks.get(order.price, [])
-            if order in level:
-                level.remove(order)
-            if not level and order.price in self.asks:
-                del self.asks[order.price]
+            book, prices = self.asks, self._ask_prices
+        level = book.get(order.price, [])
+        if order in level:
+            level.remove(order)
+            self._n_orders -= 1
+        if not level and order.price in book:
+            self._drop_level(book, prices, order.price)
+    
+    @staticmethod
+    def _drop_level(book: Dict[float, List[Order]], prices: List[float], price: float) -> None:
+        """Delete an empty price level from the book and the sorted price index."""
+        del book[price]
+        idx = bisect_left(prices, price)
+        if idx < len(prices) and prices[idx] == price:
+            del prices[idx]
     
     def remove_orders_by_agent(self, agent_id: int) -> int:
         """
@@ -163,7 +190,7 @@ class ProductAwareOrderBook:
             
             # Clean up empty price levels
             if not self.bids[price]:
-                del self.bids[price]
+                self._drop_level(self.bids, self._bid_prices, price)
         
         # Remove from asks
         for price in list(self.asks.keys()):
@@ -173,8 +200,9 @@ class ProductAwareOrderBook:
             
             # Clean up empty price levels
             if not self.asks[price]:
-                del self.asks[price]
+                self._drop_level(self.asks, self._ask_prices, price)
         
+        self._n_orders -= removed_count
         return removed_count
     
     def clear_all_orders(self) -> int:
@@ -187,6 +215,9 @@ class ProductAwareOrderBook:
         count = len(self)
         self.bids.clear()
         self.asks.clear()
+        self._bid_prices.clear()
+        self._ask_prices.clear()
+        self._n_orders = 0
         return count
     
     # ------------------------------------------------------------------
@@ -200,10 +231,9 @@ class ProductAwareOrderBook:
         Returns:
             Best bid order, or None if no bids exist
         """
-        if not self.bids:
+        if not self._bid_prices:
             return None
-        best_price = max(self.bids.keys())
-        level = self.bids[best_price]
+        level = self.bids[self._bid_prices[-1]]
         return level[0] if level else None
     
     def best_ask(self) -> Optional[Order]:
@@ -213,10 +243,9 @@ class ProductAwareOrderBook:
         Returns:
             Best ask order, or None if no asks exist
         """
-        if not self.asks:
+        if not self._ask_prices:
             return None
-        best_price = min(self.asks.keys())
-        level = self.asks[best_price]
+        level = self.asks[self._ask_prices[0]]
         return level[0] if level else None
     
     def best_bid_price(self) -> Optional[float]:
@@ -292,9 +321,14 @@ class ProductAwareOrderBook:
             incoming.volume -= traded_volume
             best_ask.volume -= traded_volume
             
-            # Remove filled resting order
+            # Remove filled resting order (always the head of the best level)
             if best_ask.volume <= 0:
-                self.remove_order(best_ask)
+                price = self._ask_prices[0]
+                level = self.asks[price]
+                level.pop(0)
+                self._n_orders -= 1
+                if not level:
+                    self._drop_level(self.asks, self._ask_prices, price)
         
         return trades
     
@@ -331,9 +365,14 @@ class ProductAwareOrderBook:
             incoming.volume -= traded_volume
             best_bid.volume -= traded_volume
             
-            # Remove filled resting order
+            # Remove filled resting order (always the head of the best level)
             if best_bid.volume <= 0:
-                self.remove_order(best_bid)
+                price = self._bid_prices[-1]
+                level = self.bids[price]
+                level.pop(0)
+                self._n_orders -= 1
+                if not level:
+                    self._drop_level(self.bids, self._bid_prices, price)
         
         return trades
     
@@ -343,9 +382,7 @@ class ProductAwareOrderBook:
     
     def __len__(self) -> int:
         """Total number of orders in the book."""
-        bid_count = sum(len(orders) for orders in self.bids.values())
-        ask_count = sum(len(orders) for orders in self.asks.values())
-        return bid_count + ask_count
+        return self._n_orders
     
     def __repr__(self) -> str:
         return (
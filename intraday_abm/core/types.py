@@ -17,10 +17,17 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Dict, List, TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from intraday_abm.core.product import Product
 
 
+# Forecasts stay float64: float32 rounding shifts imbalances enough to change
+# order volumes and thus seeded trade sequences
+FORECAST_DTYPE = np.float64
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -224,7 +231,7 @@ class AgentPrivateInfo:
 # MULTI-PRODUCT PRIVATE INFO
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class MultiProductPrivateInfo:
     """
     Agent-specific private information indexed by product.
@@ -237,7 +244,7 @@ class MultiProductPrivateInfo:
     - revenues[product_id]: r_{i,t,d} - cumulative revenue from trading product d
     - imbalances[product_id]: δ_{i,t,d} - imbalance for product d
     - da_positions[product_id]: p_i^{DA,d} - day-ahead position for product d
-    - forecasts[product_id]: forecast for product d (variable agents)
+    - forecasts[product_index[product_id]]: forecast for product d (variable agents)
     - limit_buy / limit_sell: price limits (GLOBAL across all products)
     
     Attributes:
@@ -246,13 +253,21 @@ class MultiProductPrivateInfo:
         imbalances: Dict[product_id, float] - imbalances per product
         imbalance_costs: Dict[product_id, float] - imbalance costs per product
         da_positions: Dict[product_id, float] - day-ahead positions per product
-        forecasts: Dict[product_id, float] - forecasts per product (optional)
+        forecasts: np.ndarray (float64) - forecasts per product, in product order (optional)
+        product_index: Dict[product_id, int] - position of each product in forecasts
         capacities: Dict[product_id, float] - capacities per product (optional)
         est_imb_price_up: Dict[product_id, float] - estimated upward imbalance prices
         est_imb_price_down: Dict[product_id, float] - estimated downward imbalance prices
         soc: Optional[float] - State of Charge (for BESS, global across products)
         limit_buy: Maximum price willing to pay (l^buy in Shinde) (€/MWh)
         limit_sell: Minimum price willing to accept (l^sell in Shinde) (€/MWh)
+        limit_buy_initial: Initial buy limit (l_buy_init), None if not adaptive
+        limit_sell_initial: Initial sell limit (l_sell_init), None if not adaptive
+    
+    Note:
+        Uses __slots__ (no per-instance __dict__), so all attributes must be
+        declared as fields here. Instances compare by identity (eq=False):
+        a field-wise == would compare the forecasts arrays, which raises.
     
     Example:
         # Initialize for 3 products
@@ -276,10 +291,11 @@ class MultiProductPrivateInfo:
     imbalances: Dict[int, float] = field(default_factory=dict)
     imbalance_costs: Dict[int, float] = field(default_factory=dict)
     da_positions: Dict[int, float] = field(default_factory=dict)
-    forecasts: Dict[int, float] = field(default_factory=dict)
+    forecasts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=FORECAST_DTYPE))
     capacities: Dict[int, float] = field(default_factory=dict)
     est_imb_price_up: Dict[int, float] = field(default_factory=dict)
     est_imb_price_down: Dict[int, float] = field(default_factory=dict)
+    product_index: Dict[int, int] = field(default_factory=dict)
     
     # Global state (not per-product)
     soc: Optional[float] = None  # For BESS agents
@@ -288,6 +304,10 @@ class MultiProductPrivateInfo:
     limit_buy: float = 100.0    # Maximum price to pay (l^buy)
     limit_sell: float = 0.0     # Minimum price to sell (l^sell)
     
+    # Initial limits for adaptive limit prices (DispatchableAgent)
+    limit_buy_initial: Optional[float] = None
+    limit_sell_initial: Optional[float] = None
+    
     @classmethod
     def initialize(
         cls,
@@ -298,6 +318,7 @@ class MultiProductPrivateInfo:
         initial_soc: Optional[float] = None,
         limit_buy: float = 100.0,
         limit_sell: float = 0.0,
+        forecasts: Optional[np.ndarray] = None,
     ) -> MultiProductPrivateInfo:
         """
         Initialize MultiProductPrivateInfo with default values for all products.
@@ -310,10 +331,15 @@ class MultiProductPrivateInfo:
             initial_soc: Initial state of charge for BESS (default None)
             limit_buy: Maximum price willing to pay (default 100.0)
             limit_sell: Minimum price willing to accept (default 0.0)
+            forecasts: Optional per-product forecast vector in product order;
+                overrides initial_forecast (copied)
             
         Returns:
             Initialized MultiProductPrivateInfo instance
         
+        Raises:
+            ValueError: If forecasts does not have one entry per product
+        
         Example:
             products = create_hourly_products(n_hours=24)
             info = MultiProductPrivateInfo.initialize(
@@ -326,16 +352,31 @@ class MultiProductPrivateInfo:
         """
         product_ids = [p.product_id for p in products]
         
+        if forecasts is not None:
+            forecasts = np.array(forecasts, dtype=FORECAST_DTYPE)
+            if forecasts.shape != (len(product_ids),):
+                raise ValueError(
+                    f"forecasts shape {forecasts.shape} must match n_products ({len(product_ids)})"
+                )
+        else:
+            forecasts = np.full(
+                len(product_ids),
+                initial_forecast if initial_forecast is not None else 0.0,
+                dtype=FORECAST_DTYPE
+            )
+        
+        # dict.fromkeys broadcasts each scalar over all products in C
         return cls(
-            positions={pid: 0.0 for pid in product_ids},
-            revenues={pid: 0.0 for pid in product_ids},
-            imbalances={pid: 0.0 for pid in product_ids},
-            imbalance_costs={pid: 0.0 for pid in product_ids},
-            da_positions={pid: initial_da_position for pid in product_ids},
-            forecasts={pid: initial_forecast if initial_forecast is not None else 0.0 for pid in product_ids},
-            capacities={pid: initial_capacity for pid in product_ids},
-            est_imb_price_up={pid: 0.0 for pid in product_ids},
-            est_imb_price_down={pid: 0.0 for pid in product_ids},
+            positions=dict.fromkeys(product_ids, 0.0),
+            revenues=dict.fromkeys(product_ids, 0.0),
+            imbalances=dict.fromkeys(product_ids, 0.0),
+            imbalance_costs=dict.fromkeys(product_ids, 0.0),
+            da_positions=dict.fromkeys(product_ids, initial_da_position),
+            forecasts=forecasts,
+            capacities=dict.fromkeys(product_ids, initial_capacity),
+            est_imb_price_up=dict.fromkeys(product_ids, 0.0),
+            est_imb_price_down=dict.fromkeys(product_ids, 0.0),
+            product_index={pid: i for i, pid in enumerate(product_ids)},
             soc=initial_soc,
             limit_buy=limit_buy,
             limit_sell=limit_sell
@@ -377,12 +418,22 @@ class MultiProductPrivateInfo:
             'imbalance': self.imbalances.get(product_id, 0.0),
             'imbalance_cost': self.imbalance_costs.get(product_id, 0.0),
             'da_position': self.da_positions.get(product_id, 0.0),
-            'forecast': self.forecasts.get(product_id, 0.0),
+            'forecast': self.get_forecast(product_id),
             'capacity': self.capacities.get(product_id, 0.0),
             'est_imb_price_up': self.est_imb_price_up.get(product_id, 0.0),
             'est_imb_price_down': self.est_imb_price_down.get(product_id, 0.0),
         }
     
+    def get_forecast(self, product_id: int, default: float = 0.0) -> float:
+        """
+        Get forecast for a specific product.
+        
+        Returns default for a product_id without a forecast entry (as the
+        former forecasts.get(product_id, default) on the dict did).
+        """
+        idx = self.product_index.get(product_id)
+        return default if idx is None else float(self.forecasts[idx])
+    
     def get_products_with_imbalance(self, min_imbalance: float = 0.01) -> List[int]:
         """Get list of products with non-zero imbalance."""
         return [
@@ -413,6 +464,20 @@ class MultiProductPrivateInfo:
             self.revenues[product_id] = 0.0
         self.revenues[product_id] += delta
     
+    def apply_trade(self, product_id: int, signed_volume: float, price: float) -> None:
+        """
+        Update position and revenue for one fill in a single step.
+        
+        Args:
+            product_id: Product traded
+            signed_volume: +volume for SELL, -volume for BUY
+            price: Trade price
+        """
+        positions = self.positions
+        revenues = self.revenues
+        positions[product_id] = positions.get(product_id, 0.0) + signed_volume
+        revenues[product_id] = revenues.get(product_id, 0.0) + signed_volume * price
+    
     def update_imbalance(self, product_id: int, imbalance: float) -> None:
         """Set imbalance for a specific product."""
         self.imbalances[product_id] = imbalance
@@ -422,5 +487,15 @@ class MultiProductPrivateInfo:
         self.update_imbalance(product_id, imbalance)
     
     def update_forecast(self, product_id: int, forecast: float) -> None:
-        """Update forecast for a specific product."""
-        self.forecasts[product_id] = forecast
\ No newline at end of file
+        """
+        Update forecast for a specific product.
+        
+        An unknown product_id gets a new entry appended to forecasts (like
+        the other update methods, and the former forecasts dict).
+        """
+        idx = self.product_index.get(product_id)
+        if idx is None:
+            self.product_index[product_id] = len(self.forecasts)
+            self.forecasts = np.append(self.forecasts, self.forecasts.dtype.type(forecast))
+            return
+        self.forecasts[idx] = forecast
\ No newline at end of file
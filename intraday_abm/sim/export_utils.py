@@ -10,6 +10,9 @@ def save_log_to_csv(log: Dict[str, List[Any]], filepath: str) -> None:
     Speichert das Log-Dictionary als CSV mit:
     - Semikolon als Trennzeichen (Excel-kompatibel)
     - Dezimaltrennzeichen ',' statt '.'
+
+    Raises:
+        ValueError: Wenn die Spalten unterschiedlich lang sind
     """
 
     # Zielordner anlegen, falls nicht vorhanden
@@ -20,27 +23,21 @@ def save_log_to_csv(log: Dict[str, List[Any]], filepath: str) -> None:
     # Spaltennamen
     fieldnames = list(log.keys())
 
-    # Anzahl Zeilen anhand der ersten Spalte
-    n_rows = len(next(iter(log.values())))
-
-    # CSV schreiben
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=';')
-        writer.writeheader()
-
-        for i in range(n_rows):
-            row = {key: log[key][i] for key in fieldnames}
-
-            # Dezimalpunkt -> Komma konvertieren
-            converted_row = {}
-            for key, value in row.items():
-                if isinstance(value, float):
-                    # Float in String + "." -> ","
-                    converted_row[key] = str(value).replace(".", ",")
-                elif value is None:
-                    # None -> leere Zelle
-                    converted_row[key] = ""
-                else:
-                    converted_row[key] = value
-
-            writer.writerow(converted_row)
+    # CSV schreiben (1 MiB Puffer)
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1024 * 1024) as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(fieldnames)
+
+        # Spaltenweise konvertieren, dann zeilenweise zusammensetzen
+        # (strict: ungleich lange Spalten brechen ab statt abgeschnitten zu werden)
+        columns = [[_format_cell(value) for value in log[key]] for key in fieldnames]
+        writer.writerows(zip(*columns, strict=True))
+
+
+def _format_cell(value: Any) -> Any:
+    """Float: Dezimalpunkt -> Komma; None: leere Zelle; sonst unverändert."""
+    if isinstance(value, float):
+        return str(value).replace(".", ",")
+    if value is None:
+        return ""
+    return value
@@ -13,22 +13,27 @@ FIXED VERSION:
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
-from random import Random
+
+import numpy as np
 
 from intraday_abm.agents.base import Agent
 from intraday_abm.core.product import Product, ProductStatus
 from intraday_abm.core.multi_product_market_operator import MultiProductMarketOperator
 from intraday_abm.core.order import Order
+from intraday_abm.core.types import PublicInfo, Side
 
 
 # Global debug file handle
 _sim_debug_file = None
 
+# Debug lines are buffered (no flush per line); close_sim_debug_file() writes the rest
+DEBUG_WRITE_BUFFER = 1024 * 1024
+
 
 def set_sim_debug_file(filepath: str):
     """Set the simulation debug output file."""
     global _sim_debug_file
-    _sim_debug_file = open(filepath, 'w', encoding='utf-8')
+    _sim_debug_file = open(filepath, 'w', encoding='utf-8', buffering=DEBUG_WRITE_BUFFER)
 
 
 def close_sim_debug_file():
@@ -44,7 +49,96 @@ def sim_debug_print(msg: str):
     global _sim_debug_file
     if _sim_debug_file:
         _sim_debug_file.write(msg + '\n')
-        _sim_debug_file.flush()
+
+
+class MultiProductMarketLog(dict):
+    """
+    Market log with series preallocated as NumPy arrays of length n_steps.
+    
+    Behaves like the plain dict-of-lists log: the market-level series
+    (``t``, ``n_trades``, ``total_volume``, ``n_open_products``,
+    ``total_orders``) are 1-D arrays written by step index, and
+    ``log[f"p{pid}_trades"]``, ``log[f"p{pid}_volume"]`` and
+    ``log[f"p{pid}_orders"]`` are row views into the matrices ``trades``,
+    ``volume`` and ``orders``, so summaries and exports can also work on
+    all products at once.
+    
+    Attributes:
+        product_ids: Product IDs in row order
+        product_index: Mapping product_id -> row index
+        column_keys: (trades, volume, orders) column names per product row
+        trades: Number of trades per product and step
+        volume: Traded volume (MW) per product and step
+        orders: Resting orders per product and step
+    """
+    
+    # Market-level series, in export column order
+    SERIES = ("t", "n_trades", "total_volume", "n_open_products", "total_orders")
+    
+    def __init__(self, products: List[Product], n_steps: int):
+        super().__init__(
+            t=np.zeros(n_steps, dtype=np.int32),
+            n_trades=np.zeros(n_steps, dtype=np.int32),
+            total_volume=np.zeros(n_steps, dtype=np.float64),
+            n_open_products=np.zeros(n_steps, dtype=np.int32),
+            total_orders=np.zeros(n_steps, dtype=np.int32),
+        )
+        self.product_ids = [p.product_id for p in products]
+        self.product_index = {pid: i for i, pid in enumerate(self.product_ids)}
+        
+        n_products = len(self.product_ids)
+        self.trades = np.zeros((n_products, n_steps), dtype=np.int32)
+        self.volume = np.zeros((n_products, n_steps), dtype=np.float64)
+        self.orders = np.zeros((n_products, n_steps), dtype=np.int32)
+        
+        # Column names per product row, formatted once
+        self.column_keys = [
+            (f"p{pid}_trades", f"p{pid}_volume", f"p{pid}_orders") for pid in self.product_ids
+        ]
+        
+        for i, (pid, (trades_key, volume_key, orders_key)) in enumerate(
+            zip(self.product_ids, self.column_keys)
+        ):
+            self[trades_key] = self.trades[i]
+            self[volume_key] = self.volume[i]
+            self[orders_key] = self.orders[i]
+            self[f"p{pid}_status"] = []
+    
+    def export_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Numeric columns in export order: market series, then per product
+        p{pid}_trades, p{pid}_volume, p{pid}_orders.
+        
+        Returns:
+            Dict mapping column name to its array (no copies)
+        """
+        columns = {name: self[name] for name in self.SERIES}
+        for keys in self.column_keys:
+            for key in keys:
+                columns[key] = self[key]
+        return columns
+    
+    def csv_columns(self) -> Dict[str, list]:
+        """
+        Export columns as Python lists, with the cell values of the original
+        csv.writer export (same order as export_columns()).
+        
+        The original log summed per-product volumes with sum(), so
+        p{pid}_volume is int 0 in steps without trades in that product;
+        all other values are the ints/floats of the arrays.
+        
+        Returns:
+            Dict mapping column name to a list of Python values
+        """
+        columns = {name: self[name].tolist() for name in self.SERIES}
+        for trades_key, volume_key, orders_key in self.column_keys:
+            trades = self[trades_key].tolist()
+            columns[trades_key] = trades
+            columns[volume_key] = [
+                volume if n else 0 for volume, n in zip(self[volume_key].tolist(), trades)
+            ]
+            columns[orders_key] = self[orders_key].tolist()
+        return columns
 
 
 def run_multi_product_simulation(
@@ -53,7 +147,7 @@ def run_multi_product_simulation(
     n_steps: int,
     seed: int = 42,
     verbose: bool = False
-) -> tuple[Dict[str, List], Dict[int, Dict[str, List]], MultiProductMarketOperator]:
+) -> tuple[MultiProductMarketLog, Dict[int, Dict[str, Any]], MultiProductMarketOperator]:
     """
     Run multi-product continuous intraday market simulation.
     
@@ -61,14 +155,16 @@ def run_multi_product_simulation(
         products: List of Product instances (delivery periods)
         agents: List of Agent instances (traders)
         n_steps: Number of simulation steps
-        seed: Random seed
+        seed: Random seed (kept for API compatibility; all randomness comes
+            from the agents' and pricing strategies' own RNGs)
         verbose: Print progress output
         
     Returns:
-        Tuple of (market_log, agent_logs, market_operator)
+        Tuple of (market_log, agent_logs, market_operator). Agent series are
+        NumPy arrays of length n_steps; multi-product agents additionally
+        have (n_products, n_steps) matrices "positions", "revenues" and
+        "imbalances" with p{pid}_position/_revenue/_imbalance as row views.
     """
-    rng = Random(seed)
-    
     # Initialize market operator with proper order books
     mo = MultiProductMarketOperator.from_products(products)
     # Update initial statuses (open products where gate_open has passed)
@@ -79,43 +175,43 @@ def run_multi_product_simulation(
     # ============================================================================
     agent_by_id = {ag.id: ag for ag in agents}
     
-    # Initialize logging dictionaries
-    market_log = {
-        "t": [],
-        "n_trades": [],
-        "total_volume": [],
-        "n_open_products": [],
-        "total_orders": [],
-    }
-    
-    # Per-product logging
-    for product in products:
-        pid = product.product_id
-        market_log[f"p{pid}_trades"] = []
-        market_log[f"p{pid}_volume"] = []
-        market_log[f"p{pid}_orders"] = []
-        market_log[f"p{pid}_status"] = []
+    # Initialize market log (per-product series as preallocated matrices)
+    market_log = MultiProductMarketLog(products, n_steps)
+    
+    # Per-product log keys, built once instead of f-strings in the step loop
+    product_ids = market_log.product_ids
+    status_keys = [f"p{pid}_status" for pid in product_ids]
+    position_keys = [f"p{pid}_position" for pid in product_ids]
+    revenue_keys = [f"p{pid}_revenue" for pid in product_ids]
+    imbalance_keys = [f"p{pid}_imbalance" for pid in product_ids]
+    product_keys = list(zip(product_ids, position_keys, revenue_keys, imbalance_keys))
+    status_series = [market_log[key] for key in status_keys]
     
     # Agent logging
     agent_logs = {}
+    n_products = len(product_ids)
     for agent in agents:
         agent_log = {
             "agent_id": agent.id,
             "agent_type": agent.__class__.__name__,
-            "t": [],
-            "total_revenue": [],
-            "total_position": [],
-            "total_imbalance": [],
-            "n_orders_placed": [],
+            # Aggregate series preallocated and written by step index
+            "t": np.zeros(n_steps, dtype=np.int32),
+            "total_revenue": np.zeros(n_steps, dtype=np.float64),
+            "total_position": np.zeros(n_steps, dtype=np.float64),
+            "total_imbalance": np.zeros(n_steps, dtype=np.float64),
+            "n_orders_placed": np.zeros(n_steps, dtype=np.int32),
         }
         
-        # Per-product state for multi-product agents
+        # Per-product state for multi-product agents: (n_products, n_steps)
+        # matrices written one column per step; p{pid}_* are row views
         if agent.is_multi_product:
-            for product in products:
-                pid = product.product_id
-                agent_log[f"p{pid}_position"] = []
-                agent_log[f"p{pid}_revenue"] = []
-                agent_log[f"p{pid}_imbalance"] = []
+            agent_log["positions"] = np.zeros((n_products, n_steps), dtype=np.float64)
+            agent_log["revenues"] = np.zeros((n_products, n_steps), dtype=np.float64)
+            agent_log["imbalances"] = np.zeros((n_products, n_steps), dtype=np.float64)
+            for row, (_, pos_key, rev_key, imb_key) in enumerate(product_keys):
+                agent_log[pos_key] = agent_log["positions"][row]
+                agent_log[rev_key] = agent_log["revenues"][row]
+                agent_log[imb_key] = agent_log["imbalances"][row]
         
         agent_logs[agent.id] = agent_log
     
@@ -125,8 +221,9 @@ def run_multi_product_simulation(
         print("="*60)
         print(f"Products: {len(products)}")
         print(f"Agents: {len(agents)}")
-        print(f"  - Multi-Product: {sum(1 for a in agents if a.is_multi_product)}")
-        print(f"  - Single-Product: {sum(1 for a in agents if not a.is_multi_product)}")
+        n_multi = sum(1 for a in agents if a.is_multi_product)
+        print(f"  - Multi-Product: {n_multi}")
+        print(f"  - Single-Product: {len(agents) - n_multi}")
         print(f"Steps: {n_steps}")
         print("="*60)
     
@@ -137,30 +234,33 @@ def run_multi_product_simulation(
     sim_debug_print(f"Agents: {len(agents)}")
     sim_debug_print(f"Steps: {n_steps}")
     
+    # Debug output is formatted only when a debug file is set
+    debug = _sim_debug_file is not None
+    
     # Main simulation loop
     for t in range(n_steps):
-        sim_debug_print(f"\n{'='*60}")
-        sim_debug_print(f"STEP {t}")
-        sim_debug_print(f"{'='*60}")
+        if debug:
+            sim_debug_print(f"\n{'='*60}")
+            sim_debug_print(f"STEP {t}")
+            sim_debug_print(f"{'='*60}")
         
         # Update product lifecycle (open/close/settle)
         closed_products = mo.update_product_status(t)
         if verbose and closed_products and t % 50 == 0:
             print(f"  t={t}: Closed products {closed_products}")
-        if closed_products:
+        if debug and closed_products:
             sim_debug_print(f"Closed products: {closed_products}")
         
         # Get currently open products
         open_product_ids = mo.get_open_products(t)
-        sim_debug_print(f"\nOpen products: {open_product_ids}")
+        if debug:
+            sim_debug_print(f"\nOpen products: {open_product_ids}")
         
         # Track trades this step
         step_trades = []
         step_volume = 0.0
         
         # Build public info for all open products
-        from intraday_abm.core.types import PublicInfo
-        
         public_info = {}
         for product_id in open_product_ids:
             tob = mo.get_tob(product_id)
@@ -174,48 +274,54 @@ def run_multi_product_simulation(
         
         # Agent decision and order processing
         for agent in agents:
-            sim_debug_print(f"\n--- Agent {agent.id} (is_multi_product={agent.is_multi_product}) ---")
+            if debug:
+                sim_debug_print(f"\n--- Agent {agent.id} (is_multi_product={agent.is_multi_product}) ---")
             
             # Multi-Product or Single-Product?
             if agent.is_multi_product:
                 # Multi-Product Agent: decide_orders()
-                sim_debug_print(f"Calling decide_orders() for Agent {agent.id}...")
+                if debug:
+                    sim_debug_print(f"Calling decide_orders() for Agent {agent.id}...")
                 
                 orders_dict = agent.decide_orders(t, public_info)
                 
-                sim_debug_print(f"Agent {agent.id} returned orders for {len(orders_dict)} products")
+                if debug:
+                    sim_debug_print(f"Agent {agent.id} returned orders for {len(orders_dict)} products")
                 
                 # Process orders for each product
                 for product_id, order_or_list in orders_dict.items():
                     if product_id not in open_product_ids:
-                        sim_debug_print(f"  Product {product_id} not in open_product_ids - SKIPPING")
+                        if debug:
+                            sim_debug_print(f"  Product {product_id} not in open_product_ids - SKIPPING")
                         continue  # Skip closed products
                     
                     # Handle single order or list of orders
                     orders = order_or_list if isinstance(order_or_list, list) else [order_or_list]
                     
-                    sim_debug_print(f"  Product {product_id}: Processing {len(orders)} orders")
+                    if debug:
+                        sim_debug_print(f"  Product {product_id}: Processing {len(orders)} orders")
                     
                     for idx, order in enumerate(orders):
                         if order is None:
-                            sim_debug_print(f"    Order {idx}: None - SKIPPING")
+                            if debug:
+                                sim_debug_print(f"    Order {idx}: None - SKIPPING")
                             continue
                         
-                        sim_debug_print(f"    Order {idx}: Agent {order.agent_id}, {order.side.name}, "
-                                      f"{order.volume:.2f} MW @ {order.price:.2f} €, Product {order.product_id}")
+                        if debug:
+                            sim_debug_print(f"    Order {idx}: Agent {order.agent_id}, {order.side.name}, "
+                                          f"{order.volume:.2f} MW @ {order.price:.2f} €, Product {order.product_id}")
                         
                         # Process order
                         try:
                             trades = mo.process_order(order, t, validate_time=True)
                             
-                            sim_debug_print(f"      → Processed successfully, {len(trades)} trades generated")
+                            if debug:
+                                sim_debug_print(f"      → Processed successfully, {len(trades)} trades generated")
                             
                             # ============================================================================
                             # FIX: Update BOTH buyer AND seller (not just current agent)
                             # ============================================================================
                             for trade in trades:
-                                from intraday_abm.core.types import Side
-                                
                                 # Update BUYER (might be current agent OR resting order counterparty)
                                 buyer = agent_by_id.get(trade.buy_agent_id)
                                 if buyer:
@@ -225,7 +331,8 @@ def run_multi_product_simulation(
                                         side=Side.BUY,
                                         product_id=trade.product_id
                                     )
-                                    sim_debug_print(f"      → Agent {trade.buy_agent_id} was BUYER in trade")
+                                    if debug:
+                                        sim_debug_print(f"      → Agent {trade.buy_agent_id} was BUYER in trade")
                                 
                                 # Update SELLER (might be current agent OR resting order counterparty)
                                 seller = agent_by_id.get(trade.sell_agent_id)
@@ -236,21 +343,24 @@ def run_multi_product_simulation(
                                         side=Side.SELL,
                                         product_id=trade.product_id
                                     )
-                                    sim_debug_print(f"      → Agent {trade.sell_agent_id} was SELLER in trade")
+                                    if debug:
+                                        sim_debug_print(f"      → Agent {trade.sell_agent_id} was SELLER in trade")
                                 
                                 step_trades.append(trade)
                                 step_volume += trade.volume
                         
                         except ValueError as e:
                             # Product not open anymore
-                            sim_debug_print(f"      → ValueError: {e}")
+                            if debug:
+                                sim_debug_print(f"      → ValueError: {e}")
                             if verbose and "not open" in str(e).lower():
                                 pass  # Silently ignore
                             else:
                                 if verbose:
                                     print(f"  Warning: {e}")
                         except Exception as e:
-                            sim_debug_print(f"      → Exception: {type(e).__name__}: {e}")
+                            if debug:
+                                sim_debug_print(f"      → Exception: {type(e).__name__}: {e}")
                             if verbose:
                                 print(f"  Warning: {type(e).__name__}: {e}")
             
@@ -258,49 +368,54 @@ def run_multi_product_simulation(
                 # Single-Product Agent: fallback to decide_order()
                 # Use first open product
                 if not open_product_ids:
-                    sim_debug_print(f"Agent {agent.id}: No open products for single-product agent")
+                    if debug:
+                        sim_debug_print(f"Agent {agent.id}: No open products for single-product agent")
                     continue
                 
                 fallback_product_id = open_product_ids[0]
                 fallback_public_info = public_info[fallback_product_id]
                 
-                sim_debug_print(f"Calling decide_order() for Agent {agent.id} (fallback to Product {fallback_product_id})...")
+                if debug:
+                    sim_debug_print(f"Calling decide_order() for Agent {agent.id} (fallback to Product {fallback_product_id})...")
                 
                 order_or_list = agent.decide_order(t, fallback_public_info)
                 
                 if order_or_list is None:
-                    sim_debug_print(f"Agent {agent.id} returned None")
+                    if debug:
+                        sim_debug_print(f"Agent {agent.id} returned None")
                     continue
                 
                 # Handle single order or list of orders
                 orders = order_or_list if isinstance(order_or_list, list) else [order_or_list]
                 
-                sim_debug_print(f"Agent {agent.id} returned {len(orders)} orders")
+                if debug:
+                    sim_debug_print(f"Agent {agent.id} returned {len(orders)} orders")
                 
                 for idx, order in enumerate(orders):
                     if order is None:
-                        sim_debug_print(f"  Order {idx}: None - SKIPPING")
+                        if debug:
+                            sim_debug_print(f"  Order {idx}: None - SKIPPING")
                         continue
                     
                     # Set product_id if not set
                     if order.product_id is None or order.product_id == 0:
                         order.product_id = fallback_product_id
                     
-                    sim_debug_print(f"  Order {idx}: Agent {order.agent_id}, {order.side.name}, "
-                                  f"{order.volume:.2f} MW @ {order.price:.2f} €, Product {order.product_id}")
+                    if debug:
+                        sim_debug_print(f"  Order {idx}: Agent {order.agent_id}, {order.side.name}, "
+                                      f"{order.volume:.2f} MW @ {order.price:.2f} €, Product {order.product_id}")
                     
                     # Process order
                     try:
                         trades = mo.process_order(order, t, validate_time=True)
                         
-                        sim_debug_print(f"    → Processed successfully, {len(trades)} trades generated")
+                        if debug:
+                            sim_debug_print(f"    → Processed successfully, {len(trades)} trades generated")
                         
                         # ============================================================================
                         # FIX: Update BOTH buyer AND seller (not just current agent)
                         # ============================================================================
                         for trade in trades:
-                            from intraday_abm.core.types import Side
-                            
                             # Update BUYER
                             buyer = agent_by_id.get(trade.buy_agent_id)
                             if buyer:
@@ -309,7 +424,8 @@ def run_multi_product_simulation(
                                     price=trade.price,
                                     side=Side.BUY
                                 )
-                                sim_debug_print(f"    → Agent {trade.buy_agent_id} was BUYER in trade")
+                                if debug:
+                                    sim_debug_print(f"    → Agent {trade.buy_agent_id} was BUYER in trade")
                             
                             # Update SELLER
                             seller = agent_by_id.get(trade.sell_agent_id)
@@ -319,21 +435,25 @@ def run_multi_product_simulation(
                                     price=trade.price,
                                     side=Side.SELL
                                 )
-                                sim_debug_print(f"    → Agent {trade.sell_agent_id} was SELLER in trade")
+                                if debug:
+                                    sim_debug_print(f"    → Agent {trade.sell_agent_id} was SELLER in trade")
                             
                             step_trades.append(trade)
                             step_volume += trade.volume
                     
                     except ValueError as e:
-                        sim_debug_print(f"    → ValueError: {e}")
+                        if debug:
+                            sim_debug_print(f"    → ValueError: {e}")
                         if verbose and "not open" not in str(e).lower():
                             print(f"  Warning: {e}")
                     except Exception as e:
-                        sim_debug_print(f"    → Exception: {type(e).__name__}: {e}")
+                        if debug:
+                            sim_debug_print(f"    → Exception: {type(e).__name__}: {e}")
                         if verbose:
                             print(f"  Warning: {type(e).__name__}: {e}")
         
-        sim_debug_print(f"\nStep {t} summary: {len(step_trades)} trades, {step_volume:.2f} MW")
+        if debug:
+            sim_debug_print(f"\nStep {t} summary: {len(step_trades)} trades, {step_volume:.2f} MW")
         
         # Update imbalances for all agents and products
         for agent in agents:
@@ -347,49 +467,46 @@ def run_multi_product_simulation(
                 agent.update_imbalance(t)
         
         # Log market state
-        market_log["t"].append(t)
-        market_log["n_trades"].append(len(step_trades))
-        market_log["total_volume"].append(step_volume)
-        market_log["n_open_products"].append(len(open_product_ids))
-        market_log["total_orders"].append(mo.total_orders())
+        market_log["t"][t] = t
+        market_log["n_trades"][t] = len(step_trades)
+        market_log["total_volume"][t] = step_volume
+        market_log["n_open_products"][t] = len(open_product_ids)
+        market_log["total_orders"][t] = mo.total_orders()
         
-        # Log per-product state
-        for product in products:
-            pid = product.product_id
-            
-            # Count trades for this product
-            product_trades = [tr for tr in step_trades if tr.product_id == pid]
-            product_volume = sum(tr.volume for tr in product_trades)
-            
-            market_log[f"p{pid}_trades"].append(len(product_trades))
-            market_log[f"p{pid}_volume"].append(product_volume)
-            market_log[f"p{pid}_orders"].append(len(mo.order_books[pid]) if pid in mo.order_books else 0)
-            market_log[f"p{pid}_status"].append(mo.products[pid].status.name if pid in mo.products else "UNKNOWN")
+        # Log per-product state (single pass over this step's trades)
+        product_index = market_log.product_index
+        for tr in step_trades:
+            row = product_index[tr.product_id]
+            market_log.trades[row, t] += 1
+            market_log.volume[row, t] += tr.volume
+        
+        for row, pid in enumerate(product_ids):
+            market_log.orders[row, t] = len(mo.order_books[pid]) if pid in mo.order_books else 0
+            status_series[row].append(mo.products[pid].status.name if pid in mo.products else "UNKNOWN")
         
         # Log agent state
         for agent in agents:
             agent_log = agent_logs[agent.id]
-            agent_log["t"].append(t)
+            agent_log["t"][t] = t
             
             if agent.is_multi_product:
                 pi = agent.private_info
-                agent_log["total_revenue"].append(pi.total_revenue())
-                agent_log["total_position"].append(pi.total_position())
-                agent_log["total_imbalance"].append(pi.total_imbalance())
-                agent_log["n_orders_placed"].append(0)  # TODO: track
+                agent_log["total_revenue"][t] = pi.total_revenue()
+                agent_log["total_position"][t] = pi.total_position()
+                agent_log["total_imbalance"][t] = pi.total_imbalance()
+                # n_orders_placed: TODO track (stays 0)
                 
-                # Per-product state
-                for product in products:
-                    pid = product.product_id
-                    agent_log[f"p{pid}_position"].append(pi.positions.get(pid, 0.0))
-                    agent_log[f"p{pid}_revenue"].append(pi.revenues.get(pid, 0.0))
-                    agent_log[f"p{pid}_imbalance"].append(pi.imbalances.get(pid, 0.0))
+                # Per-product state (one column per step)
+                positions, revenues, imbalances = pi.positions, pi.revenues, pi.imbalances
+                agent_log["positions"][:, t] = [positions.get(pid, 0.0) for pid in product_ids]
+                agent_log["revenues"][:, t] = [revenues.get(pid, 0.0) for pid in product_ids]
+                agent_log["imbalances"][:, t] = [imbalances.get(pid, 0.0) for pid in product_ids]
             else:
                 pi = agent.private_info
-                agent_log["total_revenue"].append(pi.revenue)
-                agent_log["total_position"].append(pi.market_position)
-                agent_log["total_imbalance"].append(pi.imbalance)
-                agent_log["n_orders_placed"].append(0)  # TODO: track
+                agent_log["total_revenue"][t] = pi.revenue
+                agent_log["total_position"][t] = pi.market_position
+                agent_log["total_imbalance"][t] = pi.imbalance
+                # n_orders_placed: TODO track (stays 0)
         
         # Progress output
         if verbose and t % 50 == 0:
@@ -481,8 +598,8 @@ def run_multi_product_simulation(
     # ============================================================================
     
     if verbose:
-        total_trades = sum(market_log["n_trades"])
-        total_volume = sum(market_log["total_volume"])
+        total_trades = int(np.sum(market_log["n_trades"]))
+        total_volume = float(np.sum(market_log["total_volume"]))
         print("\n" + "="*60)
         print("SIMULATION COMPLETE")
         print("="*60)
@@ -494,7 +611,7 @@ def run_multi_product_simulation(
 
 
 def print_simulation_summary(
-    market_log: Dict[str, List],
+    market_log: MultiProductMarketLog,
     agent_logs: Dict[int, Dict[str, List]],
     mo: MultiProductMarketOperator
 ) -> None:
@@ -511,9 +628,10 @@ def print_simulation_summary(
     print("="*60)
     
     # Market statistics
-    total_trades = sum(market_log["n_trades"])
-    total_volume = sum(market_log["total_volume"])
-    avg_trades_per_step = total_trades / len(market_log["t"]) if market_log["t"] else 0
+    n_steps = len(market_log["t"])
+    total_trades = int(np.sum(market_log["n_trades"]))
+    total_volume = float(np.sum(market_log["total_volume"]))
+    avg_trades_per_step = total_trades / n_steps if n_steps else 0
     
     print(f"\nMarket Statistics:")
     print(f"  Total Trades: {total_trades}")
@@ -527,12 +645,17 @@ def print_simulation_summary(
     # Show first 10 products or all if fewer
     sample_products = products[:min(10, len(products))]
     
+    # Per-product totals in one reduction over the (n_products, n_steps) matrices
+    trades_per_product = market_log.trades.sum(axis=1)
+    volume_per_product = market_log.volume.sum(axis=1)
+    
     for product in sample_products:
         pid = product.product_id
-        product_trades = market_log[f"p{pid}_trades"][-1] if f"p{pid}_trades" in market_log else 0
-        product_volume = market_log[f"p{pid}_volume"][-1] if f"p{pid}_volume" in market_log else 0.0
+        row = market_log.product_index[pid]
+        product_trades = int(trades_per_product[row])
+        product_volume = float(volume_per_product[row])
         
-        product_name = product.name if hasattr(product, 'name') and product.name else f"Product {pid}"
+        product_name = product.name or f"Product {pid}"
         print(f"  {product_name}: {product_trades} trades, {product_volume:.1f} MW")
     
     if len(products) > 10:
@@ -541,12 +664,11 @@ def print_simulation_summary(
     # Agent statistics
     print(f"\nAgent Statistics:")
     for agent_id, agent_log in agent_logs.items():
-        if not agent_log["t"]:
+        if not len(agent_log["t"]):
             continue
         
         final_revenue = agent_log["total_revenue"][-1]
         final_position = agent_log["total_position"][-1]
-        agent_type = agent_log["agent_type"]
         
         print(f"  Agent {agent_id}: Revenue={final_revenue:.2f} €, Position={final_position:.2f} MW")
     
@@ -1,5 +1,7 @@
 """Utility modules for intraday market simulation"""
 
 from .logging import setup_logger, get_logger, SimulationLogger, quick_logger
+from .io import load_results, load_log_parquet
 
-__all__ = ['setup_logger', 'get_logger', 'SimulationLogger', 'quick_logger']
\ No newline at end of file
+__all__ = ['setup_logger', 'get_logger', 'SimulationLogger', 'quick_logger',
+           'load_results', 'load_log_parquet']
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Loading exported simulation results
+
+The Demo4 market log can be exported as CSV, Parquet or Feather
+(see run_multi_product_simulation.export_results). The binary formats are
+columnar, so readers can pull single columns (e.g. 't', 'p12_volume')
+without parsing the other ~290.
+
+Usage:
+    from intraday_abm.utils.io import load_results, load_log_parquet
+
+    # Eager DataFrame, optionally column-pruned
+    df = load_results('results/demo4_simulation.parquet', columns=['t', 'p12_volume'])
+
+    # Lazy pyarrow dataset (requires pyarrow)
+    ds = load_log_parquet('results/demo4_simulation.parquet')
+    table = ds.to_table(columns=['t', 'p12_volume'])
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+
+def load_log_parquet(path: str):
+    """
+    Open an exported Parquet market log as a lazy pyarrow dataset.
+
+    Nothing is read until ds.to_table(columns=[...]) / ds.to_batches(),
+    so only the requested columns are loaded from disk.
+
+    Args:
+        path: Path to a Parquet file (or a directory of Parquet files)
+
+    Returns:
+        pyarrow.dataset.Dataset
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow.dataset as ds
+
+    return ds.dataset(path, format='parquet')
+
+
+def load_results(path: str, columns: Optional[List[str]] = None):
+    """
+    Load an exported market log into a DataFrame, based on file suffix.
+
+    Args:
+        path: Path to a .csv, .parquet or .feather export
+        columns: Optional subset of columns to load
+
+    Returns:
+        pandas.DataFrame
+    """
+    import pandas as pd
+
+    suffix = Path(path).suffix.lower()
+    if suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns)
+    if suffix in ('.feather', '.arrow'):
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
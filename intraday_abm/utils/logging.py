@@ -102,8 +102,10 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers to avoid duplicates
-    logger.handlers = []
+    # Remove (and close) existing handlers to avoid duplicates
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
     
     # Console Handler
     if log_to_console:
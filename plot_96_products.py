@@ -9,6 +9,7 @@ Creates multi-level visualization:
 
 Usage:
     python plot_96_products.py results/demo4_quarterly_96products.csv
+    python plot_96_products.py results/demo4_simulation.parquet
 """
 
 import pandas as pd
@@ -22,6 +23,8 @@ from multiprocessing import Pool
 import warnings
 warnings.filterwarnings('ignore')
 
+from intraday_abm.utils.io import load_results
+
 # Styling
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -59,9 +62,9 @@ class ProductPlotter:
         self._load_data()
         
     def _load_data(self):
-        """Load and preprocess CSV data."""
-        print("📊 Loading CSV data...")
-        self.df = pd.read_csv(self.csv_file)
+        """Load and preprocess result data (CSV, Parquet or Feather)."""
+        print("📊 Loading result data...")
+        self.df = load_results(self.csv_file)
         print(f"✅ Loaded {len(self.df)} rows")
         
         # Extract product names and info from CSV
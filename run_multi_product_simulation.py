@@ -11,6 +11,12 @@ Usage:
     # Simple - just run with defaults
     python Demo4.py
     
+    # Quick health check (300 steps, 3 hours of products, 5 agents, no file output)
+    python Demo4.py --smoke
+    
+    # Predefined configuration by name (see PRESET_CONFIGS)
+    python Demo4.py --config high_liquidity
+    
     # Advanced - customize configuration
     from Demo4 import run_demo4
     from intraday_abm.config_params.demo4_config import Demo4Config
@@ -19,18 +25,30 @@ Usage:
     run_demo4(custom_config)
 """
 
-import time
+import argparse
+import logging
 import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional
-
-import os
 from random import Random
-from typing import List, Dict
+from typing import Dict, List, Optional
 
-from intraday_abm.sim.multi_product_simulation import run_multi_product_simulation
-from intraday_abm.core.product import create_quarterly_products, print_quarterly_products_summary
-from intraday_abm.config_params.multi_product_config import DEFAULT_DEMO4_CONFIG, Demo4Config
+import numpy as np
+# pandas and the optional pyarrow (Parquet/Feather) are imported inside the
+# export helpers only, so runs without export do not pay their import cost
+
+from intraday_abm.sim.multi_product_simulation import run_multi_product_simulation, MultiProductMarketLog
+from intraday_abm.core.product import (
+    create_quarterly_products,
+    print_quarterly_products_summary,
+    QUARTERS_PER_HOUR,
+)
+from intraday_abm.config_params.multi_product_config import (
+    DEFAULT_DEMO4_CONFIG,
+    PRESET_CONFIGS,
+    Demo4Config,
+)
 from intraday_abm.utils.logging import setup_logger, SimulationLogger
 
 # Agent imports
@@ -41,6 +59,10 @@ from intraday_abm.agents.dispatchable import DispatchableAgent
 from intraday_abm.agents.pricing_strategies import NaivePricingStrategy
 
 
+# Write buffer for CSV export (bytes)
+CSV_WRITE_BUFFER = 1024 * 1024
+
+
 def setup_logging_from_config(config: Demo4Config):
     """
     Setup logging based on configuration.
@@ -53,21 +75,20 @@ def setup_logging_from_config(config: Demo4Config):
     """
     if not config.enable_logging:
         # Minimal logging if disabled
-        import logging
         logging.basicConfig(level=logging.WARNING)
         logger = logging.getLogger('demo4')
         return logger, None
     
     # Create logs directory
-    log_dir = Path(config.results_dir) / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
+    log_dir = os.path.join(config.results_dir, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
     
     # Setup logger
-    log_file = log_dir / config.log_filename if config.log_to_file else None
+    log_file = os.path.join(log_dir, config.log_filename) if config.log_to_file else None
     
     logger = setup_logger(
         name='demo4',
-        log_file=str(log_file) if log_file else None,
+        log_file=log_file,
         level=config.log_level,
         log_to_console=config.log_to_console,
         use_colors=True
@@ -79,40 +100,53 @@ def setup_logging_from_config(config: Demo4Config):
     return logger, sim_logger
 
 
+def create_pricing_strategy(ps_params: dict) -> NaivePricingStrategy:
+    """Create a Naive Pricing Strategy from a config 'pricing_strategy' dict (own RNG per agent)."""
+    return NaivePricingStrategy(
+        rng=Random(ps_params['seed']),
+        pi_range=ps_params['pi_range'],
+        n_segments=ps_params['n_segments'],
+        n_orders=ps_params['n_orders'],
+        min_price=ps_params['min_price'],
+        max_price=ps_params['max_price']
+    )
+
+
 def create_variable_agents(config: Demo4Config, products: List) -> List[VariableAgent]:
     """Create Variable Agents (Wind/Solar) from configuration."""
     agents = []
     
     print(f"\n👥 Creating {config.n_variable_agents} VariableAgents (Diverse Forecasts):")
     
+    # Agent-independent daily shape (hour of each quarterly product)
+    hours = np.arange(len(products)) // QUARTERS_PER_HOUR
+    day_mask = (hours >= 6) & (hours < 20)
+    solar_shape = np.where(day_mask, 1.0 + 0.5 * ((hours - 13) / 7.0) ** 2, 0.0)
+    wind_shape = 1.0 + 0.2 * (hours / 24.0)
+    solar_share = config.variable_solar_share
+    wind_share = config.variable_wind_share
+    sample_rows = [
+        (hour, hour * QUARTERS_PER_HOUR) for hour in (0, 6, 12, 18)
+        if hour * QUARTERS_PER_HOUR < len(products)
+    ]
+    
     for i in range(config.n_variable_agents):
         params = config.get_variable_agent_params(i)
         
+        # Create diverse forecast patterns (Solar + Wind), vectorized over products
+        base = params['base_forecast']
+        solar_component = base * solar_share * solar_shape
+        wind_component = base * wind_share * wind_shape
+        
         # Create Multi-Product PrivateInfo
         priv_info = MultiProductPrivateInfo.initialize(
             products=products,
             initial_capacity=params['capacity'],
             limit_buy=params['limit_buy'],
-            limit_sell=params['limit_sell']
+            limit_sell=params['limit_sell'],
+            forecasts=np.maximum(10.0, solar_component + wind_component)
         )
         
-        # Create diverse forecast patterns (Solar + Wind)
-        for pid in range(len(products)):
-            hour = pid // 4
-            
-            # Solar pattern (higher during day, zero at night)
-            if 6 <= hour < 20:
-                solar_factor = 1.0 + 0.5 * ((hour - 13) / 7.0) ** 2
-                solar_component = params['base_forecast'] * config.variable_solar_share * solar_factor
-            else:
-                solar_component = 0.0
-            
-            # Wind pattern (more stable)
-            wind_component = params['base_forecast'] * config.variable_wind_share * (1.0 + 0.2 * (hour / 24.0))
-            
-            forecast = solar_component + wind_component
-            priv_info.forecasts[pid] = max(10.0, forecast)
-        
         # Create agent
         agent = VariableAgent(
             id=params['id'],
@@ -123,12 +157,14 @@ def create_variable_agents(config: Demo4Config, products: List) -> List[Variable
             imbalance_tolerance=params['imbalance_tolerance']
         )
         
-        # Show sample forecasts
-        sample_forecasts = [priv_info.forecasts[pid] for pid in [0, 24, 48, 72]]
+        # Show sample forecasts (first quarter of hours 0/6/12/18, where they exist)
+        sample_forecasts = ", ".join(
+            f"H{hour:02d}: {priv_info.get_forecast(products[row].product_id):.0f}"
+            for hour, row in sample_rows
+        )
         print(f"   Agent {agent.id}: "
               f"Limits [Buy: {params['limit_buy']:.1f}, Sell: {params['limit_sell']:.1f}], "
-              f"Forecasts [H00: {sample_forecasts[0]:.0f}, H06: {sample_forecasts[1]:.0f}, "
-              f"H12: {sample_forecasts[2]:.0f}, H18: {sample_forecasts[3]:.0f}] MW")
+              f"Forecasts [{sample_forecasts}] MW")
         
         agents.append(agent)
     
@@ -165,15 +201,7 @@ def create_random_liquidity_agents(config: Demo4Config, products: List) -> List[
         )
         
         # Assign Shinde-compliant Naive Pricing Strategy
-        ps_params = params['pricing_strategy']
-        agent.pricing_strategy = NaivePricingStrategy(
-            rng=Random(ps_params['seed']),
-            pi_range=ps_params['pi_range'],
-            n_segments=ps_params['n_segments'],
-            n_orders=ps_params['n_orders'],
-            min_price=ps_params['min_price'],
-            max_price=ps_params['max_price']
-        )
+        agent.pricing_strategy = create_pricing_strategy(params['pricing_strategy'])
         
         print(f"   Agent {agent.id}: "
               f"Limits [Buy: {params['limit_buy']:.1f}, Sell: {params['limit_sell']:.1f}]")
@@ -225,15 +253,7 @@ def create_thermal_agents(config: Demo4Config, products: List) -> List[Dispatcha
         )
         
         # Assign pricing strategy
-        ps_params = params['pricing_strategy']
-        agent.pricing_strategy = NaivePricingStrategy(
-            rng=Random(ps_params['seed']),
-            pi_range=ps_params['pi_range'],
-            n_segments=ps_params['n_segments'],
-            n_orders=ps_params['n_orders'],
-            min_price=ps_params['min_price'],
-            max_price=ps_params['max_price']
-        )
+        agent.pricing_strategy = create_pricing_strategy(params['pricing_strategy'])
         
         print(f"   Agent {agent.id}: "
               f"MC={params['marginal_cost']} €/MWh, "
@@ -247,153 +267,171 @@ def create_thermal_agents(config: Demo4Config, products: List) -> List[Dispatcha
     return agents
 
 
-def print_simulation_summary(log: Dict, agent_logs: Dict, agents: List, products: List, config: Demo4Config):
+def print_simulation_summary(log: MultiProductMarketLog, agent_logs: Dict, agents: List, products: List, config: Demo4Config):
     """Print scientific summary of simulation results."""
-    print("\n" + "="*70)
-    print("SIMULATION RESULTS - SCIENTIFIC SUMMARY")
-    print("="*70)
+    # Collect the report and write it in one go instead of one print() per line
+    lines = []
+    out = lines.append
+    
+    out("\n" + "="*70)
+    out("SIMULATION RESULTS - SCIENTIFIC SUMMARY")
+    out("="*70)
     
     # Market Overview
-    print(f"\n{'─'*70}")
-    print("1. MARKET OVERVIEW")
-    print(f"{'─'*70}")
+    out(f"\n{'─'*70}")
+    out("1. MARKET OVERVIEW")
+    out(f"{'─'*70}")
+    
+    # Convert the per-step series once; all statistics below are array reductions
+    n_trades = np.asarray(log["n_trades"])
+    n_open = np.asarray(log["n_open_products"])
     
-    total_trades = sum(log["n_trades"])
-    total_volume = sum(log["total_volume"])
+    total_trades = int(n_trades.sum())
+    # Sequential sum (as before): np.sum's pairwise sum can flip the last printed digit
+    total_volume = sum(np.asarray(log["total_volume"]).tolist())
     avg_trade_size = total_volume / total_trades if total_trades > 0 else 0
     n_steps = len(log["t"])
     
-    print(f"\nAggregate Statistics:")
-    print(f"  Total Trades:        {total_trades:>10,}")
-    print(f"  Total Volume:        {total_volume:>10,.1f} MW")
-    print(f"  Average Trade Size:  {avg_trade_size:>10.2f} MW")
-    print(f"  Trades per Step:     {total_trades/n_steps:>10.2f}")
-    print(f"  Simulation Steps:    {n_steps:>10,}")
+    out(f"\nAggregate Statistics:")
+    out(f"  Total Trades:        {total_trades:>10,}")
+    out(f"  Total Volume:        {total_volume:>10,.1f} MW")
+    out(f"  Average Trade Size:  {avg_trade_size:>10.2f} MW")
+    out(f"  Trades per Step:     {total_trades/n_steps if n_steps > 0 else 0:>10.2f}")
+    out(f"  Simulation Steps:    {n_steps:>10,}")
     
     # Trading intensity
-    steps_with_trades = sum(1 for n in log["n_trades"] if n > 0)
+    steps_with_trades = int(np.count_nonzero(n_trades > 0))
     market_activity = steps_with_trades / n_steps * 100 if n_steps > 0 else 0
     
-    print(f"\nMarket Efficiency:")
-    print(f"  Steps with Trades:   {steps_with_trades:>10,} ({market_activity:.1f}%)")
-    print(f"  Max Open Products:   {max(log['n_open_products']):>10}")
-    print(f"  Avg Open Products:   {sum(log['n_open_products'])/n_steps:>10.1f}")
+    out(f"\nMarket Efficiency:")
+    out(f"  Steps with Trades:   {steps_with_trades:>10,} ({market_activity:.1f}%)")
+    out(f"  Max Open Products:   {int(n_open.max()) if n_steps > 0 else 0:>10}")
+    out(f"  Avg Open Products:   {float(n_open.mean()) if n_steps > 0 else 0.0:>10.1f}")
     
     # Agent Performance Summary
-    print(f"\n{'─'*70}")
-    print("2. AGENT PERFORMANCE SUMMARY")
-    print(f"{'─'*70}")
-    
-    # Group by type
-    variable_agents = [a for a in agents if isinstance(a, VariableAgent)]
-    random_agents = [a for a in agents if isinstance(a, RandomLiquidityAgent)]
-    thermal_agents = [a for a in agents if isinstance(a, DispatchableAgent)]
-    
-    if variable_agents:
-        var_revenues = [agent_logs[a.id]['total_revenue'][-1] if agent_logs[a.id]['total_revenue'] else 0.0 
-                       for a in variable_agents]
-        print(f"\nVariable Agents (n={len(variable_agents)}):")
-        print(f"  Total Revenue:       {sum(var_revenues):>10,.0f} €")
-        print(f"  Avg Revenue:         {sum(var_revenues)/len(var_revenues):>10,.0f} €")
-        print(f"  Max Revenue:         {max(var_revenues):>10,.0f} €")
-    
-    if random_agents:
-        rand_revenues = [agent_logs[a.id]['total_revenue'][-1] if agent_logs[a.id]['total_revenue'] else 0.0
-                        for a in random_agents]
-        print(f"\nRandom Liquidity Agents (n={len(random_agents)}):")
-        print(f"  Total Revenue:       {sum(rand_revenues):>10,.0f} €")
-        print(f"  Avg Revenue:         {sum(rand_revenues)/len(rand_revenues):>10,.0f} €")
-    
-    if thermal_agents:
-        therm_revenues = [agent_logs[a.id]['total_revenue'][-1] if agent_logs[a.id]['total_revenue'] else 0.0
-                         for a in thermal_agents]
-        print(f"\nThermal Agents (n={len(thermal_agents)}):")
-        print(f"  Total Revenue:       {sum(therm_revenues):>10,.0f} €")
-        print(f"  Avg Revenue:         {sum(therm_revenues)/len(therm_revenues):>10,.0f} €")
-        print(f"  Max Revenue:         {max(therm_revenues):>10,.0f} €")
+    out(f"\n{'─'*70}")
+    out("2. AGENT PERFORMANCE SUMMARY")
+    out(f"{'─'*70}")
+    
+    # Final revenue per agent (0.0 for an empty log), grouped by agent type
+    # via boolean masks; isinstance, so subclasses count with their base type
+    revenues = np.array(
+        [
+            agent_logs[a.id]['total_revenue'][-1] if len(agent_logs[a.id]['total_revenue']) else 0.0
+            for a in agents
+        ],
+        dtype=np.float64,
+    )
     
-    print("\n" + "="*70)
+    var_revenues = revenues[np.array([isinstance(a, VariableAgent) for a in agents], dtype=bool)]
+    rand_revenues = revenues[np.array([isinstance(a, RandomLiquidityAgent) for a in agents], dtype=bool)]
+    therm_revenues = revenues[np.array([isinstance(a, DispatchableAgent) for a in agents], dtype=bool)]
+    
+    if var_revenues.size:
+        out(f"\nVariable Agents (n={var_revenues.size}):")
+        out(f"  Total Revenue:       {var_revenues.sum():>10,.0f} €")
+        out(f"  Avg Revenue:         {var_revenues.mean():>10,.0f} €")
+        out(f"  Max Revenue:         {var_revenues.max():>10,.0f} €")
+    
+    if rand_revenues.size:
+        out(f"\nRandom Liquidity Agents (n={rand_revenues.size}):")
+        out(f"  Total Revenue:       {rand_revenues.sum():>10,.0f} €")
+        out(f"  Avg Revenue:         {rand_revenues.mean():>10,.0f} €")
+    
+    if therm_revenues.size:
+        out(f"\nThermal Agents (n={therm_revenues.size}):")
+        out(f"  Total Revenue:       {therm_revenues.sum():>10,.0f} €")
+        out(f"  Avg Revenue:         {therm_revenues.mean():>10,.0f} €")
+        out(f"  Max Revenue:         {therm_revenues.max():>10,.0f} €")
+    
+    out("\n" + "="*70)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def export_results(log: Dict, products: List, config: Demo4Config):
-    """Export results to CSV if configured."""
-    if not config.export_csv:
-        return
+def build_results_frame(log: MultiProductMarketLog):
+    """Assemble the market log as a DataFrame (aggregate + per-product columns)."""
+    import pandas as pd
     
-    import csv
+    return pd.DataFrame(log.export_columns())
+
+
+def export_results(log: MultiProductMarketLog, products: List, config: Demo4Config):
+    """Export results to CSV, Parquet and/or Feather if configured."""
+    if not (config.export_csv or config.export_parquet or config.export_feather):
+        return
     
     os.makedirs(config.results_dir, exist_ok=True)
-    filepath = os.path.join(config.results_dir, config.csv_filename)
     
-    print(f"\n💾 Exporting results to {filepath}...")
-    
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Header
-        header = ["t", "n_trades", "total_volume", "n_open_products", "total_orders"]
-        for pid in range(len(products)):
-            header.extend([f"p{pid}_trades", f"p{pid}_volume", f"p{pid}_orders"])
-        writer.writerow(header)
-        
-        # Data
-        for i in range(len(log["t"])):
-            row = [
-                log["t"][i],
-                log["n_trades"][i],
-                log["total_volume"][i],
-                log["n_open_products"][i],
-                log["total_orders"][i]
-            ]
-            
-            for pid in range(len(products)):
-                row.extend([
-                    log[f"p{pid}_trades"][i],
-                    log[f"p{pid}_volume"][i],
-                    log[f"p{pid}_orders"][i]
-                ])
-            
-            writer.writerow(row)
-    
-    print(f"✅ Exported {len(log['t'])} rows to {filepath}")
+    if config.export_csv:
+        filepath = os.path.join(config.results_dir, config.csv_filename)
+        print(f"\n💾 Exporting results to {filepath}...")
+        export_results_to_csv(log, filepath)
+        print(f"✅ Exported {len(log['t'])} rows to {filepath}")
+        print(f"   File size: {os.path.getsize(filepath) / 1024 / 1024:.2f} MB")
+    
+    # The columnar formats go through pandas; CSV does not need the frame
+    if config.export_parquet or config.export_feather:
+        df = build_results_frame(log)
+    
+    if config.export_parquet:
+        export_results_to_parquet(df, os.path.join(config.results_dir, config.parquet_filename),
+                                  compression=config.export_compression)
+    
+    if config.export_feather:
+        export_results_to_feather(df, os.path.join(config.results_dir, config.feather_filename),
+                                  compression=config.export_compression)
 
 
-def setup_logging_from_config(config: Demo4Config):
+def export_results_to_csv(log: MultiProductMarketLog, filepath: str):
     """
-    Setup logging based on configuration.
+    Write the market log to CSV, cell for cell like the original csv.writer export.
     
-    Args:
-        config: Demo4Config instance
-        
-    Returns:
-        Tuple of (base_logger, sim_logger)
+    Cell values come from MultiProductMarketLog.csv_columns() (int 0 for
+    per-product volumes without trades); lines end in CRLF (csv.writer default).
     """
-    if not config.enable_logging:
-        # Minimal logging if disabled
-        import logging
-        logging.basicConfig(level=logging.WARNING)
-        logger = logging.getLogger('demo4')
-        return logger, None
-    
-    # Create logs directory
-    log_dir = Path(config.results_dir) / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Setup logger
-    log_file = log_dir / config.log_filename if config.log_to_file else None
-    
-    logger = setup_logger(
-        name='demo4',
-        log_file=str(log_file) if log_file else None,
-        level=config.log_level,
-        log_to_console=config.log_to_console,
-        use_colors=True
-    )
+    _write_numeric_csv(log.csv_columns(), filepath)
+
+
+def _write_numeric_csv(columns: Dict[str, list], filepath: str):
+    """
+    Write numeric columns as CSV without csv.writer/pandas quoting logic.
     
-    # Create high-level simulation logger
-    sim_logger = SimulationLogger(logger)
+    Every value is an int or float, so nothing needs quoting: each row is
+    formatted with one precomputed %s-template (str() per cell, as
+    csv.writer does) and written through a 1 MiB buffer.
+    """
+    header = ",".join(columns) + "\r\n"
+    row_fmt = ",".join(["%s"] * len(columns)) + "\r\n"
     
-    return logger, sim_logger
+    with open(filepath, 'w', newline='', buffering=CSV_WRITE_BUFFER) as f:
+        f.write(header)
+        f.writelines(row_fmt % row for row in zip(*columns.values()))
+
+
+def export_results_to_parquet(df, filepath: str, compression: str = 'zstd'):
+    """Write the results frame to Parquet; skipped if no Parquet engine is installed."""
+    print(f"\n💾 Exporting results to {filepath}...")
+    try:
+        df.to_parquet(filepath, index=False, compression=None if compression == 'none' else compression)
+    except ImportError as e:
+        print(f"⚠️  Parquet export skipped: {e}")
+        return
+    print(f"✅ Exported {len(df)} rows to {filepath}")
+    print(f"   File size: {os.path.getsize(filepath) / 1024 / 1024:.2f} MB")
+
+
+def export_results_to_feather(df, filepath: str, compression: str = 'zstd'):
+    """Write the results frame to Feather (Arrow IPC); skipped if pyarrow is not installed."""
+    print(f"\n💾 Exporting results to {filepath}...")
+    try:
+        # Feather kennt nur lz4/zstd
+        df.to_feather(filepath, compression=compression if compression in ('zstd', 'lz4') else 'uncompressed')
+    except ImportError as e:
+        print(f"⚠️  Feather export skipped: {e}")
+        return
+    print(f"✅ Exported {len(df)} rows to {filepath}")
+    print(f"   File size: {os.path.getsize(filepath) / 1024 / 1024:.2f} MB")
 
 
 def run_demo4(config: Optional[Demo4Config] = None):
@@ -405,12 +443,22 @@ def run_demo4(config: Optional[Demo4Config] = None):
         
     Returns:
         Tuple of (log, agent_logs, market_operator, products)
+    
+    Raises:
+        ValueError: If config.n_products is not a multiple of 4 (whole hours)
     """
     
     # Use default config if none provided
     if config is None:
         config = DEFAULT_DEMO4_CONFIG
     
+    # Products are created per hour (4 quarters each)
+    if config.n_products % QUARTERS_PER_HOUR:
+        raise ValueError(
+            f"n_products ({config.n_products}) must be a multiple of {QUARTERS_PER_HOUR} "
+            f"(quarter-hour products per hour)"
+        )
+    
     # Setup logging
     logger, sim_logger = setup_logging_from_config(config)
     
@@ -443,7 +491,7 @@ def run_demo4(config: Optional[Demo4Config] = None):
         logger.info("Creating %d quarterly products...", config.n_products)
     
     products = create_quarterly_products(
-        n_hours=24,
+        n_hours=config.n_products // QUARTERS_PER_HOUR,
         start_time=config.start_time_minutes,
         gate_open_offset_hours=config.gate_open_offset_hours,
         gate_close_offset_minutes=config.gate_close_offset_minutes,
@@ -533,8 +581,8 @@ def run_demo4(config: Optional[Demo4Config] = None):
     elapsed_time = time.time() - start_time
     
     # Log completion
-    total_trades = sum(log["n_trades"])
-    total_volume = sum(log["total_volume"])
+    total_trades = int(log["n_trades"].sum())
+    total_volume = float(log["total_volume"].sum())
     
     if sim_logger:
         sim_logger.simulation_end(total_trades, total_volume, elapsed_time)
@@ -552,9 +600,9 @@ def run_demo4(config: Optional[Demo4Config] = None):
     print_simulation_summary(log, agent_logs, agents, products, config)
     
     # Export results
-    if config.export_csv:
+    if config.export_csv or config.export_parquet or config.export_feather:
         if logger:
-            logger.info("Exporting results to CSV...")
+            logger.info("Exporting results...")
         export_results(log, products, config)
     
     # Final status
@@ -570,16 +618,35 @@ def run_demo4(config: Optional[Demo4Config] = None):
         csv_path = Path(config.results_dir) / config.csv_filename
         print(f"📊 Results CSV: {csv_path}")
     
+    parquet_path = Path(config.results_dir) / config.parquet_filename
+    if config.export_parquet and parquet_path.exists():
+        print(f"📊 Results Parquet: {parquet_path}")
+    
+    feather_path = Path(config.results_dir) / config.feather_filename
+    if config.export_feather and feather_path.exists():
+        print(f"📊 Results Feather: {feather_path}")
+    
     print()
     
     return log, agent_logs, mo, products
 
 
 def main():
-    """Main entry point - runs Demo4 with default configuration"""
+    """Main entry point - runs Demo4 with default configuration (or a named preset)"""
+    parser = argparse.ArgumentParser(description="Demo 4: 96-product quarterly simulation")
+    parser.add_argument('--config', choices=sorted(PRESET_CONFIGS), default='default',
+                        help="predefined configuration to run (default: %(default)s)")
+    parser.add_argument('--smoke', action='store_true',
+                        help="shortcut for --config smoke: 300 steps over 12 quarter-hour "
+                             "products (3 hours), 5 agents, no file output")
+    args = parser.parse_args()
+    preset = 'smoke' if args.smoke else args.config
     
     # Simply run with defaults - that's it!
-    log, agent_logs, mo, products = run_demo4()
+    t0 = time.perf_counter_ns()
+    log, agent_logs, mo, products = run_demo4(PRESET_CONFIGS[preset])
+    if preset == 'smoke':
+        print(f"Smoke run finished in {(time.perf_counter_ns() - t0) / 1e6:.1f} ms")
     
     # Optional: Do something with results
     # analyze_results(log, agent_logs)
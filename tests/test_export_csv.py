@@ -0,0 +1,74 @@
+"""
+Round-trip check of the Demo4 CSV export against the original csv.writer export.
+
+Run from the repository root: python -m pytest tests
+"""
+
+import csv
+
+from intraday_abm.core.product import create_quarterly_products
+from intraday_abm.sim.multi_product_simulation import MultiProductMarketLog
+from run_multi_product_simulation import export_results_to_csv
+
+
+# (n_trades, volume, orders) per product and step; no trades → legacy volume is sum([]) == 0
+STEPS = [
+    [(2, 97.5, 4), (0, 0, 0), (0, 0, 1), (1, 0.1 + 0.2, 3)],
+    [(0, 0, 6), (3, 12.0, 2), (0, 0, 0), (0, 0, 0)],
+    [(0, 0, 0), (0, 0, 0), (0, 0, 0), (0, 0, 0)],
+    [(1, 1e-7, 1), (1, 1234567.891, 0), (2, 5.0, 2), (4, 33.333333333333336, 7)],
+]
+
+
+def _legacy_log(product_ids):
+    """Market log as dict of Python lists, as the original simulation loop built it."""
+    log = {key: [] for key in ("t", "n_trades", "total_volume", "n_open_products", "total_orders")}
+    for pid in product_ids:
+        log[f"p{pid}_trades"], log[f"p{pid}_volume"], log[f"p{pid}_orders"] = [], [], []
+
+    for t, step in enumerate(STEPS):
+        step_volume = 0.0
+        for pid, (n, volume, orders) in zip(product_ids, step):
+            log[f"p{pid}_trades"].append(n)
+            log[f"p{pid}_volume"].append(volume)
+            log[f"p{pid}_orders"].append(orders)
+            step_volume += volume
+        log["t"].append(t)
+        log["n_trades"].append(sum(n for n, _, _ in step))
+        log["total_volume"].append(step_volume)
+        log["n_open_products"].append(sum(1 for n, _, _ in step if n))
+        log["total_orders"].append(sum(o for _, _, o in step))
+    return log
+
+
+def _write_legacy_csv(log, product_ids, filepath):
+    """The original export_results writer (csv.writer, one row per step)."""
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        header = ["t", "n_trades", "total_volume", "n_open_products", "total_orders"]
+        for pid in product_ids:
+            header.extend([f"p{pid}_trades", f"p{pid}_volume", f"p{pid}_orders"])
+        writer.writerow(header)
+        for i in range(len(log["t"])):
+            row = [log[key][i] for key in ("t", "n_trades", "total_volume", "n_open_products", "total_orders")]
+            for pid in product_ids:
+                row.extend([log[f"p{pid}_trades"][i], log[f"p{pid}_volume"][i], log[f"p{pid}_orders"][i]])
+            writer.writerow(row)
+
+
+def test_csv_export_matches_legacy_writer(tmp_path):
+    products = create_quarterly_products(n_hours=1, seed=0)
+    product_ids = [p.product_id for p in products]
+    legacy = _legacy_log(product_ids)
+
+    log = MultiProductMarketLog(products, n_steps=len(STEPS))
+    for key in MultiProductMarketLog.SERIES:
+        log[key][:] = legacy[key]
+    for pid in product_ids:
+        for suffix in ("trades", "volume", "orders"):
+            log[f"p{pid}_{suffix}"][:] = legacy[f"p{pid}_{suffix}"]
+
+    _write_legacy_csv(legacy, product_ids, tmp_path / "legacy.csv")
+    export_results_to_csv(log, str(tmp_path / "new.csv"))
+
+    assert (tmp_path / "new.csv").read_bytes() == (tmp_path / "legacy.csv").read_bytes()